@@ -1,6 +1,7 @@
 from opgg.summoner import Summoner, Game
+from opgg.game import StatsTable
 from opgg.season import Season, SeasonInfo
-from opgg.champion import ChampionStats, Champion, Spell, Passive, Skin, Price
+from opgg.champion import ChampionStats, ChampionStatsTable, Champion, Spell, Passive, Skin, Price
 from opgg.league_stats import LeagueStats, Tier, QueueInfo
 from opgg.params import Region, By
 from opgg.cacher import Cacher
\ No newline at end of file
@@ -0,0 +1,74 @@
+# Quick and simple scraper to pull some data from OPGG using multisearch
+
+# Author  : ShoobyDoo
+# Date    : 2024-07-10
+# License : BSD-3-Clause
+
+from array import array
+from dataclasses import fields
+from types import MappingProxyType
+from typing import Callable, Iterable
+
+# shared read-only stand-in for missing sub-dicts in the from_api builders, so a missing key doesn't allocate a fresh {}
+_EMPTY = MappingProxyType({})
+
+# orjson is optional, it parses straight from bytes and is a good bit faster on the /games and champion payloads.
+# json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors, so callers only need to catch ValueError
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+class _ColumnTable:
+    """
+    Base for the column-oriented (struct of arrays) stats tables.\n
+    Each `int` field of the row dataclass (passed as `row_type=` when subclassing) is kept in its own contiguous
+    `array("q")`, so aggregates like `sum(table["kill"])` run over packed C arrays instead of loading one
+    attribute per object. Missing (None) values are stored as 0.\n
+
+    ### Properties:
+        `columns: dict[str, array]` - Mapping of stat name to its column\n
+    """
+
+    INT_COLUMNS: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, row_type: type | None = None, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if row_type is not None:
+            cls.INT_COLUMNS = tuple(f.name for f in fields(row_type) if f.type is int)
+
+    def __init__(self) -> None:
+        self.columns: dict[str, array] = {name: array("q") for name in self.INT_COLUMNS}
+
+    @classmethod
+    def from_stats(cls, stats: Iterable):
+        """
+        Build a table from row dataclass objects, one row each, in the order given.
+        """
+        table = cls()
+        table._extend(list(stats), getattr)
+        return table
+
+    @classmethod
+    def from_api(cls, rows: list[dict]):
+        """
+        Build a table straight from the raw stats dicts returned by OPGG, without creating a row object each.
+        """
+        table = cls()
+        table._extend(rows, dict.get)
+        return table
+
+    def _extend(self, rows: list, get: Callable) -> None:
+        # fill column by column, each column is a single extend() over the rows
+        for name in self.INT_COLUMNS:
+            self.columns[name].extend(get(row, name) or 0 for row in rows)
+
+    def __getitem__(self, name: str) -> array:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns[self.INT_COLUMNS[0]])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)})"
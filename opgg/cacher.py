@@ -1,3 +1,4 @@
+import sys
 import sqlite3
 import logging
 import os
@@ -8,6 +9,25 @@ from opgg.season import SeasonInfo
 from opgg.champion import Champion, Passive, Skin, Spell
 
 
+def _parse_prices(raw_prices: str | None) -> list[tuple[str, int]] | None:
+    """
+    Turn a stored "CUR: cost,CUR: cost" string back into (currency, cost) pairs.\n
+    Malformed entries (e.g. "BE: None") are skipped so one bad price doesn't break the whole cache load.
+    """
+    if not raw_prices:
+        return None
+
+    prices = []
+    for price in raw_prices.split(","):
+        currency, _, cost = price.partition(": ")
+        try:
+            prices.append((sys.intern(currency), int(cost)))
+        except ValueError:
+            continue
+
+    return prices or None
+
+
 # todo: we shouldn't be making a sqlite db to cache things. We should be using some kind of built in cache like
 #  lru or use TimedCache
 class Cacher:
@@ -597,7 +617,7 @@ class Cacher:
                 name=skin[2],
                 centered_image=skin[3],
                 skin_video_url=skin[4],
-                prices=skin[5].split(",") if skin[5] else None,
+                prices=_parse_prices(skin[5]),
                 release_date=skin[6],
             )
             for skin in result
@@ -5,436 +5,439 @@
 # License : BSD-3-Clause
 
 
+import heapq
+import sys
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
+
+from opgg._common import _ColumnTable
 from opgg.params import By
 
 
+def _intern(value: str | None) -> str | None:
+    """
+    `sys.intern` a short, frequently repeated string field. Non-str values (None) are returned as-is.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _as_tuple(value: list | tuple | None) -> tuple | None:
+    """
+    Freeze a list field scraped from OPGG into a tuple. None is kept as None.\n
+    These fields are never mutated after scraping, and tuples are smaller and don't over-allocate.
+    """
+    return tuple(value) if value is not None else None
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(value: str) -> datetime:
+    """
+    Parse an OPGG ISO date. Skins released together share a release date, so repeats are a cache hit.
+    """
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True, frozen=True)
 class Passive:
     """
-    Represents a champion's passive ability.\n
-    
+    Represents a champion's passive ability. (Read-only)\n
+
     ### Properties:
         `name: str` - Name of the passive\n
         `description: str` - Description of the passive\n
         `image_url: str` - URL to the passive image\n
         `video_url: str` - URL to the passive video\n
     """
-    def __init__(self,
-                 name: str,
-                 description: str,
-                 image_url: str,
-                 video_url: str) -> None:
-        self._name = name
-        self._description = description 
-        self._image_url = image_url
-        self._video_url = video_url
 
-    @property
-    def name(self) -> str:
-        """
-        A `str` representing the name of the passive ability.
-        """
-        return self._name
-    
-    @property
-    def description(self) -> str:
-        """
-        A `str` representing the description of the passive ability.
-        """
-        return self._description
-    
-    @property
-    def image_url(self) -> str:
-        """
-        A `str` representing the URL to the passive image.
-        """
-        return self._image_url
-    
-    @property
-    def video_url(self) -> str:
+    name: str
+    description: str
+    image_url: str
+    video_url: str
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Passive":
         """
-        A `str` representing the URL to the passive video.
+        Build a `Passive` from the raw passive dict returned by OPGG.
         """
-        return self._video_url
-    
+        return cls(
+            name=data.get("name"),
+            description=data.get("description"),
+            image_url=data.get("image_url"),
+            video_url=data.get("video_url"),
+        )
 
+
+@dataclass(slots=True, frozen=True)
 class Spell:
     """
-    Represents a champion's spell.\n
-    
+    Represents a champion's spell. (Read-only)\n
+
     ### Properties:
         `key: str` - Key of the spell\n
         `name: str` - Name of the spell\n
         `description: str` - Description of the spell\n
         `max_rank: int` - Max rank of the spell\n
-        `range_burn: list` - Range of the spell\n
-        `cooldown_burn: list` - Cooldowns of the spell\n
-        `cooldown_burn_float: list[float]` - Cooldowns of the spell as floats\n
-        `cost_burn: list` - Cost of the spell\n
+        `range_burn: tuple` - Range of the spell\n
+        `cooldown_burn: tuple` - Cooldowns of the spell\n
+        `cooldown_burn_float: tuple[float]` - Cooldowns of the spell as floats\n
+        `cost_burn: tuple` - Cost of the spell\n
         `tooltip: str` - Tooltip of the spell\n
         `image_url: str` - URL to the spell image\n
         `video_url: str` - URL to the spell video\n
     """
-    def __init__(self,
-                 key: str,
-                 name: str,
-                 description: str,
-                 max_rank: int,
-                 range_burn: list,
-                 cooldown_burn: list,
-                 cooldown_burn_float: list[float],
-                 cost_burn: list,
-                 tooltip: str,
-                 image_url: str,
-                 video_url: str) -> None:
-        self._key = key
-        self._name = name
-        self._description = description
-        self._max_rank = max_rank
-        self._range_burn = range_burn
-        self._cooldown_burn = cooldown_burn
-        self._cooldown_burn_float = cooldown_burn_float
-        self._cost_burn = cost_burn
-        self._tooltip = tooltip
-        self._image_url = image_url
-        self._video_url = video_url
 
-    @property
-    def key(self) -> str:
-        """
-        A `str` representing the keybind of the spell. (Q, W, E, R)
-        """
-        return self._key
-    
-    @property
-    def name(self) -> str:
-        """
-        A `str` representing the name of the spell.
-        """
-        return self._name
-    
-    @property
-    def description(self) -> str:
-        """
-        A `str` representing the description of the spell.
-        """
-        return self._description
-    
-    @property
-    def max_rank(self) -> int:
-        """
-        An `int` representing the max rank of the spell.
-        """
-        return self._max_rank
-    
-    @property
-    def range_burn(self) -> list:
-        """
-        A `list[int]` representing the range(s) of the spell at each rank.
-        """
-        return self._range_burn
-    
-    @property
-    def cooldown_burn(self) -> list:
-        """
-        A `list[int]` representing the cooldown(s) of the spell at each rank.
-        """
-        return self._cooldown_burn
-    
-    @property
-    def cooldown_burn_float(self) -> list[float]:
-        """
-        A `list[float]` representing the cooldown(s) of the spell at each rank in floating point numbers. (More precise)
-        """
-        return self._cooldown_burn
-    
-    @property
-    def cost_burn(self) -> list:
-        """
-        A `list[int]` representing the cost(s) of the spell at each rank.
-        """
-        return self._cost_burn
-    
-    @property
-    def tooltip(self) -> str:
-        """
-        A `str` representing the tooltip of the spell.
-        """
-        return self._tooltip
-    
-    @property
-    def image_url(self) -> str:
-        """
-        A `str` representing the URL to the spell's image.
-        """
-        return self._image_url
-    
-    @property
-    def video_url(self) -> str:
-        """
-        A `str` representing the URL to a video of the spell in use.
-        """
-        return self._video_url
-    
+    key: str
+    name: str
+    description: str
+    max_rank: int
+    range_burn: tuple
+    cooldown_burn: tuple
+    cooldown_burn_float: tuple[float, ...]
+    cost_burn: tuple
+    tooltip: str
+    image_url: str
+    video_url: str
+    _repr: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # frozen, so the normalized values have to go around the dataclass __setattr__
+        set_ = object.__setattr__
+
+        # Q/W/E/R repeats across every champion
+        set_(self, "key", _intern(self.key))
+
+        # one value per spell rank, fixed for the patch
+        set_(self, "range_burn", _as_tuple(self.range_burn))
+        set_(self, "cooldown_burn", _as_tuple(self.cooldown_burn))
+        set_(self, "cooldown_burn_float", _as_tuple(self.cooldown_burn_float))
+        set_(self, "cost_burn", _as_tuple(self.cost_burn))
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Spell":
+        """
+        Build a `Spell` from the raw spell dict returned by OPGG.
+        """
+        return cls(
+            key=data.get("key"),
+            name=data.get("name"),
+            description=data.get("description"),
+            max_rank=data.get("max_rank"),
+            range_burn=data.get("range_burn"),
+            cooldown_burn=data.get("cooldown_burn"),
+            cooldown_burn_float=data.get("cooldown_burn_float"),
+            cost_burn=data.get("cost_burn"),
+            tooltip=data.get("tooltip"),
+            image_url=data.get("image_url"),
+            video_url=data.get("video_url"),
+        )
+
     def __repr__(self) -> str:
-        return f"Skill({self.key}: {self.name})"
+        # the instance is frozen, so the repr is only built once
+        if self._repr is None:
+            object.__setattr__(self, "_repr", f"Skill({self.key}: {self.name})")
+        return self._repr
 
 
-class Price:
+class Price(NamedTuple):
     """
     Represents a price.\n
-    
+
     ### Properties:
         `currency: str` - Currency of the price\n
         `cost: int` - Cost of the price\n
     """
-    def __init__(self,
-                 currency: str,
-                 cost: int) -> None:
-        self._currency = currency
-        self._cost = cost
-    
-    @property
-    def currency(self) -> str:
-        """
-        A `str` representing the currency of the price. (BE, RP)
-        """
-        return self._currency
-    
-    @property
-    def cost(self) -> int:
-        """
-        An `int` representing the cost of the price.
-        """
-        return self._cost
-    
+
+    currency: str
+    cost: int
+
     def __repr__(self) -> str:
         return f"Price({self.currency}: {self.cost})"
 
 
+# there are only a handful of distinct (currency, cost) pairs across every skin, so Price objects are shared.
+# Price is a tuple subclass and can't be weakly referenced, but the pool is bounded by the number of price points
+_PRICE_POOL: dict[tuple[str, int], Price] = {}
+
+
+def _price(pair: tuple[str, int]) -> Price:
+    """
+    Return the shared `Price` for a (currency, cost) pair, creating it on first use.
+    """
+    price = _PRICE_POOL.get(pair)
+    if price is None:
+        price = _PRICE_POOL[pair] = Price._make(pair)
+    return price
+
+
+# OPGG reports blue essence under its old name, "IP" (influence points)
+_CURRENCY_ALIASES = {"IP": By.BLUE_ESSENCE}
+
+
+def _raw_prices(prices: list[dict] | None) -> tuple[tuple[str, int], ...]:
+    """
+    Convert OPGG's raw price dicts to (currency, cost) pairs.
+    """
+    # most skins have no prices, skip building a generator for them
+    if not prices:
+        return ()
+
+    # the "IP" -> "BE" alias is resolved here, once per price, rather than on every cost lookup.
+    # reuse the By constants so every price shares the same two interned currency strings
+    return tuple(
+        (By.RIOT_POINTS if "RP" in price.get("currency", "") else By.BLUE_ESSENCE, price.get("cost"))
+        for price in prices
+    )
+
+
 class Skin:
     """
     Represents a skin for a champion.\n
-    
+
     ### Properties:
         `id: int` - ID of the skin\n
         `champion_id: int` - ID of the champion the skin belongs to\n
         `name: str` - Name of the skin\n
         `centered_image: str` - URL to the centered image of the skin\n
         `skin_video_url: str` - URL to the skin video\n
-        `prices: list[Price]` - List of prices for the skin\n
+        `prices: tuple[Price]` - Prices for the skin\n
         `sales: list` - List of sales for the skin. Defaults to None.\n
         `release_date: datetime` - Release date of the skin\n
     """
-    def __init__(self,
-                 id: int,
-                 champion_id: int,
-                 name: str,
-                 centered_image: str,
-                 skin_video_url: str, 
-                 prices: list[Price],
-                 release_date: datetime,
-                 sales = None) -> None:
-        self._id = id
-        self._champion_id = champion_id
-        self._name = name
-        self._centered_image = centered_image 
-        self._skin_video_url = skin_video_url 
-        self._prices = prices 
-        self._sales = sales
-        self._release_date = release_date
-    
-    @property
-    def id(self) -> int:
-        """
-        An `int` representing the ID of the skin.
-        """
-        return self._id
-     
-    @property
-    def champion_id(self) -> int:
-        """
-        An `int` representing the ID of the champion the skin belongs to.
-        """
-        return self._champion_id
-     
-    @property
-    def name(self) -> str:
-        """
-        A `str` representing the name of the skin.
-        """
-        return self._name
-    
-    @property
-    def centered_image(self) -> str:
-        """
-        A `str` representing the URL to the centered image of the skin.
-        """
-        return self._centered_image
-     
-    @property
-    def skin_video_url(self) -> str:
-        """
-        A `str` representing the URL to the skin video.
-        """
-        return self._skin_video_url
-    
-    @property
-    def prices(self) -> list[Price]:
-        """
-        A `list[Price]` objects representing the prices of the skin.
-        """
+
+    __slots__ = (
+        "id",
+        "champion_id",
+        "name",
+        "centered_image",
+        "skin_video_url",
+        "release_date",
+        "sales",
+        "_raw_prices",
+        "_prices",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        champion_id: int,
+        name: str,
+        centered_image: str,
+        skin_video_url: str,
+        prices: tuple[Price | tuple[str, int], ...] | list | None,
+        release_date: datetime,
+        sales: list | None = None,
+    ) -> None:
+        self.id = id
+        self.champion_id = champion_id
+        self.name = name
+        self.centered_image = centered_image
+        self.skin_video_url = skin_video_url
+        self.release_date = release_date
+        self.sales = sales
+
+        # prices can be passed as raw (currency, cost) pairs, the Price objects are only built if they're read
+        self._raw_prices = _as_tuple(prices)
+        self._prices = None
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Skin":
+        """
+        Build a `Skin` from the raw skin dict returned by OPGG.
+        """
+        return cls(
+            id=data.get("id"),
+            champion_id=data.get("champion_id"),
+            name=data.get("name"),
+            centered_image=data.get("centered_image"),
+            skin_video_url=data.get("skin_video_url"),
+            prices=_raw_prices(data.get("prices")),
+            release_date=_parse_date(data["release_date"]) if data.get("release_date") else None,
+            sales=data.get("sales"),
+        )
+
+    @property
+    def prices(self) -> tuple[Price, ...] | None:
+        """
+        A `tuple[Price]` of objects representing the prices of the skin.
+        """
+        if self._prices is None and self._raw_prices is not None:
+            self._prices = tuple(_price(price) for price in self._raw_prices)
         return self._prices
-    
-    @property
-    def sales(self) -> list:
-        """
-        A `list` representing the sales of the skin. Defaults to None.\n
-        
-        Note: This gets returned by the API, but all values I tested returned were null/none
-        """
-        return self._sales         
-    
-    @property
-    def release_date(self) -> datetime:
-        """
-        A `datetime` object representing the release date of the skin
-        """
-        return self._release_date
-    
+
     def __repr__(self) -> str:
+        # not cached, a Skin's name can still be reassigned
         return f"Skin({self.name})"
 
 
+_LAZY_CHAMPION_FIELDS = frozenset(("passive", "spells", "skins"))
+
+
+@dataclass(slots=True, frozen=True)
 class Champion:
     """
-    Represents a champion.\n
-    
+    Represents a champion. (Read-only)\n
+
     ### Properties:
         `id: int` - ID of the champion\n
         `key: str` - Key of the champion\n
         `name: str` - Name of the champion\n
         `image_url: str` - URL to the champion image\n
-        `evolve: list` - List of evolutions for the champion\n
+        `evolve: tuple` - Evolutions for the champion\n
         `partype: str` - Resource used by champion to cast spells\n
         `passive: Passive` - Passive object for the champion\n
-        `spells: list[Spell]` - List of Spell objects for the champion\n
-        `skins: list[Skin]` - List of Skin objects for the champion\n
+        `spells: tuple[Spell]` - Spell objects for the champion\n
+        `skins: tuple[Skin]` - Skin objects for the champion\n
     """
-    def __init__(self,
-                 id: int,
-                 key: str,
-                 name: str,
-                 image_url: str,
-                 evolve: list,
-                 partype: str,
-                 passive: Passive,
-                 spells: list[Spell],
-                 skins: list[Skin]) -> None:
-        self._id = id
-        self._key = key
-        self._name = name
-        self._image_url = image_url
-        self._evolve = evolve
-        self._partype = partype
-        self._passive = passive
-        self._spells = spells
-        self._skins = skins
-        
-    @property
-    def id(self) -> int:
-        """
-        An `int` representing the ID of the champion.
-        """
-        return self._id
-     
-    @property
-    def key(self) -> str:
-        """
-        A `str` representing the key of the champion.
-        """
-        return self._key
-    
-    @property
-    def name(self) -> str:
-        """
-        A `str` representing the name of the champion.
-        """
-        return self._name
-    
-    @property
-    def image_url(self) -> str:
-        """
-        A `str` representing the URL to the champion image.
-        """
-        return self._image_url
-    
-    @property
-    def evolve(self) -> list:
-        """
-        A `list` representing the evolutions of the champion.
-        
-        Note: 99% of the time this is an empty list.
-        """
-        return self._evolve
-    
-    @property
-    def partype(self) -> str:
-        """
-        A `str` representing the resource type the champion uses to cast spells. (Mana, Energy, etc.)
-        """
-        return self._partype
-    
-    @property
-    def passive(self) -> Passive:
-        """
-        A `Passive` object representing the passive ability of the champion.
-        """
-        return self._passive
-    
-    @property
-    def spells(self) -> list[Spell]:
-        """
-        A list[Spell] objects representing the spells of the champion.
-        """
-        return self._spells
-    
-    @property
-    def skins(self) -> list[Skin]:
-        """
-        A `list[Skin]` objects representing the skins of the champion.
-        """
-        return self._skins
 
+    id: int
+    key: str
+    name: str
+    image_url: str
+    evolve: tuple
+    partype: str
+    passive: Passive
+    spells: tuple[Spell, ...]
+    skins: tuple[Skin, ...]
+    _cost_by_currency: dict[str, int] = field(init=False, repr=False, compare=False)
+    _raw: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _repr: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # frozen, so the normalized values and the derived cost table go around the dataclass __setattr__
+        set_ = object.__setattr__
+
+        # key/name are what get_champion_by matches on and partype is one of a handful of values
+        set_(self, "key", _intern(self.key))
+        set_(self, "name", _intern(self.name))
+        set_(self, "partype", _intern(self.partype))
+
+        # frozen before the cost table below is derived from the skins, so the two can't drift apart
+        set_(self, "evolve", _as_tuple(self.evolve))
+        set_(self, "spells", _as_tuple(self.spells))
+        set_(self, "skins", _as_tuple(self.skins))
+
+        # walk the skins/prices once here so cost lookups are a single dict hit.
+        # first price seen for a currency wins, which is the base skin's price.
+        # reads the raw price pairs so no Price objects get built just to answer cost lookups.
+        cost_by_currency = {}
+        for skin in self.skins or ():
+            if skin._raw_prices:
+                for currency, cost in skin._raw_prices:
+                    cost_by_currency.setdefault(currency, cost)
+
+        set_(self, "_cost_by_currency", cost_by_currency)
+
+    @classmethod
+    def from_api(cls, data: dict, lazy: bool = False) -> "Champion":
+        """
+        Build a `Champion` from the raw champion dict returned by OPGG.
+
+        ### Args:
+            data : `dict`
+                The raw champion dict. (An entry of `championsById` or the /meta/champions endpoint)
+
+            lazy : `bool, optional`
+                If True, only the top level fields are set and the `passive`, `spells` and `skins`
+                objects are built from the raw dict the first time they are accessed. Defaults to False.
+
+        ### Returns:
+            `Champion` : The champion object.
+        """
+        if not lazy:
+            return cls(
+                id=data.get("id"),
+                key=data.get("key"),
+                name=data.get("name"),
+                image_url=data.get("image_url"),
+                evolve=data.get("evolve"),
+                partype=data.get("partype"),
+                passive=Passive.from_api(data.get("passive", {})),
+                spells=tuple(Spell.from_api(spell) for spell in data.get("spells") or ()),
+                skins=tuple(Skin.from_api(skin) for skin in data.get("skins") or ()),
+            )
+
+        champion = cls.__new__(cls)
+        set_ = object.__setattr__
+        set_(champion, "id", data.get("id"))
+        set_(champion, "key", _intern(data.get("key")))
+        set_(champion, "name", _intern(data.get("name")))
+        set_(champion, "image_url", data.get("image_url"))
+        set_(champion, "evolve", _as_tuple(data.get("evolve")))
+        set_(champion, "partype", _intern(data.get("partype")))
+        set_(champion, "_raw", data)
+        set_(champion, "_repr", None)
+
+        # cost lookups read straight from the raw skins, no Skin/Price objects needed
+        cost_by_currency = {}
+        for skin in data.get("skins") or ():
+            for currency, cost in _raw_prices(skin.get("prices")):
+                cost_by_currency.setdefault(currency, cost)
+
+        set_(champion, "_cost_by_currency", cost_by_currency)
+        return champion
+
+    def __getattr__(self, name: str):
+        # only reached when a slot is unset, i.e. a lazily built champion's passive/spells/skins
+        if name in _LAZY_CHAMPION_FIELDS and self._raw is not None:
+            if name == "passive":
+                value = Passive.from_api(self._raw.get("passive", {}))
+            elif name == "spells":
+                value = tuple(Spell.from_api(spell) for spell in self._raw.get("spells") or ())
+            else:
+                value = tuple(Skin.from_api(skin) for skin in self._raw.get("skins") or ())
+
+            object.__setattr__(self, name, value)
+            return value
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def get_cost_by(self, by: By = By.BLUE_ESSENCE) -> int | None:
         """
         Get the cost of the champion.
-        
+
         ### Args:
             by : `By`
                 The currency to get the cost in. Defaults to `By.BLUE_ESSENCE`.
+
+        ### Returns:
+            `int | None` : The cost in the given currency, or `None` if the champion has no price in it.
         """
-        # Get the cost of the champion in either blue essence or riot points
-        by = "IP" if by == By.BLUE_ESSENCE else by.upper()
-        
-        for skin in self.skins:
-            if skin.prices is not None:
-                for price in skin.prices:
-                    if price.currency == by:
-                        return price.cost
-            else:
-                return None
-        
-        
+        # prices are stored as By.BLUE_ESSENCE / By.RIOT_POINTS already, so this is a plain lookup.
+        # By constants are uppercase, so only look further if the direct hit misses ("rp", "IP", ...)
+        cost = self._cost_by_currency.get(by)
+        if cost is None:
+            by = by.upper()
+            cost = self._cost_by_currency.get(_CURRENCY_ALIASES.get(by, by))
+
+        return cost
+
     def __repr__(self) -> str:
-        return f"Champion(name={self.name})"
+        # kept to scalar fields so repr-ing a list of champions never walks (or lazily builds) skins/spells
+        if self._repr is None:
+            object.__setattr__(self, "_repr", f"Champion(id={self.id}, key={self.key}, name={self.name})")
+        return self._repr
+
+    def detailed_repr(self) -> str:
+        """
+        Get a full dump of the champion, including its passive, spells and skins.
+
+        ### Returns:
+            `str` : The detailed representation.
+        """
+        return (
+            f"Champion(id={self.id}, key={self.key}, name={self.name}, partype={self.partype}, "
+            f"passive={self.passive}, spells={self.spells}, skins={self.skins})"
+        )
 
 
+@dataclass(slots=True, frozen=True)
 class ChampionStats:
     """
-    Represents the stats of the user on a given champion.\n
-    
+    Represents the stats of the user on a given champion. (Read-only)\n
+
     ### Properties:
         `champion: Champion` - Champion object\n
         `id: int` - Unique identifier for the stats\n
@@ -482,438 +485,168 @@ class ChampionStats:
         `max_largest_killing_spree: int` - Maximum largest killing spree\n
         `snowball_throws: int` - Number of snowball throws\n
         `snowball_hits: int` - Number of snowball hits\n
+        `kda: float` - KDA on the champion, computed at construction\n
     """
-    def __init__(self,
-                 champion: Champion,
-                 id: int,
-                 play: int,
-                 win: int,
-                 lose: int,
-                 kill: int,
-                 death: int,
-                 assist: int,
-                 gold_earned: int,
-                 minion_kill: int,
-                 turret_kill: int,
-                 neutral_minion_kill: int,
-                 damage_dealt: int,
-                 damage_taken: int,
-                 physical_damage_dealt: int,
-                 magic_damage_dealt: int,
-                 most_kill: int,
-                 max_kill: int,
-                 max_death: int,
-                 double_kill: int,
-                 triple_kill: int,
-                 quadra_kill: int,
-                 penta_kill: int,
-                 game_length_second: int,
-                 inhibitor_kills: int,
-                 sight_wards_bought_in_game: int,
-                 vision_wards_bought_in_game: int,
-                 vision_score: int,
-                 wards_placed: int,
-                 wards_killed: int,
-                 heal: int,
-                 time_ccing_others: int,
-                 op_score: int,
-                 is_max_in_team_op_score: int,
-                 physical_damage_taken: int,
-                 damage_dealt_to_champions: int,
-                 physical_damage_dealt_to_champions: int,
-                 magic_damage_dealt_to_champions: int,
-                 damage_dealt_to_objectives: int,
-                 damage_dealt_to_turrets: int,
-                 damage_self_mitigated: int,
-                 max_largest_multi_kill: int,
-                 max_largest_critical_strike: int,
-                 max_largest_killing_spree: int,
-                 snowball_throws: int,
-                 snowball_hits: int) -> None:
-        self._champion = champion
-        self._id = id
-        self._play = play
-        self._win = win
-        self._lose = lose
-        self._kill = kill
-        self._death = death
-        self._assist = assist
-        self._gold_earned = gold_earned
-        self._minion_kill = minion_kill 
-        self._turret_kill = turret_kill 
-        self._neutral_minion_kill = neutral_minion_kill 
-        self._damage_dealt = damage_dealt 
-        self._damage_taken = damage_taken 
-        self._physical_damage_dealt = physical_damage_dealt 
-        self._magic_damage_dealt = magic_damage_dealt 
-        self._most_kill = most_kill 
-        self._max_kill = max_kill 
-        self._max_death = max_death 
-        self._double_kill = double_kill 
-        self._triple_kill = triple_kill 
-        self._quadra_kill = quadra_kill 
-        self._penta_kill = penta_kill 
-        self._game_length_second = game_length_second
-        
-        self._inhibitor_kills = inhibitor_kills
-        self._sight_wards_bought_in_game = sight_wards_bought_in_game
-        self._vision_wards_bought_in_game = vision_wards_bought_in_game
-        self._vision_score = vision_score
-        self._wards_placed = wards_placed
-        self._wards_killed = wards_killed
-        self._heal = heal
-        self._time_ccing_others = time_ccing_others
-        self._op_score = op_score
-        self._is_max_in_team_op_score = is_max_in_team_op_score
-        self._physical_damage_taken = physical_damage_taken
-        self._damage_dealt_to_champions = damage_dealt_to_champions
-        self._physical_damage_dealt_to_champions = physical_damage_dealt_to_champions
-        self._magic_damage_dealt_to_champions = magic_damage_dealt_to_champions
-        self._damage_dealt_to_objectives = damage_dealt_to_objectives
-        self._damage_dealt_to_turrets = damage_dealt_to_turrets
-        self._damage_self_mitigated = damage_self_mitigated
-        self._max_largest_multi_kill = max_largest_multi_kill
-        self._max_largest_critical_strike = max_largest_critical_strike
-        self._max_largest_killing_spree = max_largest_killing_spree
-        self._snowball_throws = snowball_throws
-        self._snowball_hits = snowball_hits        
-        
-    @property
-    def champion(self) -> Champion:
-        """
-        A `Champion` object representing the champion.
-        """
-        return self._champion
-    
-    @property
-    def id(self) -> int:
-        """
-        An `int` representing the champion id
-        """
-        return self._id
-    
-    @property
-    def play(self) -> int:
-        """
-        An `int` representing the number of games played.
-        """
-        return self._play
 
-    @property
-    def win(self) -> int:
-        """
-        An `int` representing the number of games won.
-        """
-        return self._win
-
-    @property
-    def lose(self) -> int:
-        """
-        An `int` representing the number of games lost.
-        """
-        return self._lose
-
-    @property
-    def kill(self) -> int:
-        """
-        An `int` representing the number of kills.
-        """
-        return self._kill
-
-    @property
-    def death(self) -> int:
-        """
-        An `int` representing the number of deaths.
-        """
-        return self._death
-
-    @property
-    def assist(self) -> int:
-        """
-        An `int` representing the number of assists.
-        """
-        return self._assist
-
-    @property
-    def gold_earned(self) -> int:
-        """
-        An `int` representing the amount of gold earned.
-        """
-        return self._gold_earned
-
-    @property
-    def minion_kill(self) -> int:
-        """
-        An `int` representing the number of minions killed.
-        """
-        return self._minion_kill
- 
-    @property
-    def turret_kill(self) -> int:
-        """
-        An `int` representing the number of turrets killed.
-        """
-        return self._turret_kill
-
-    @property
-    def neutral_minion_kill(self) -> int:
-        """
-        An `int` representing the number of neutral minions killed.
-        """
-        return self._neutral_minion_kill
-
-    @property
-    def damage_dealt(self) -> int:
-        """
-        An `int` representing the amount of damage dealt.
-        """
-        return self._damage_dealt
-        
-    @property
-    def damage_taken(self) -> int:
-        """
-        An `int` representing the amount of damage taken.
-        """
-        return self._damage_taken
-        
-    @property
-    def physical_damage_dealt(self) -> int:
-        """
-        An `int` representing the amount of physical damage dealt.
-        """
-        return self._physical_damage_dealt
-        
-    @property
-    def magic_damage_dealt(self) -> int:
-        """
-        An `int` representing the amount of magic damage dealt.
-        """
-        return self._magic_damage_dealt
-
-    @property
-    def most_kill(self) -> int:
-        """
-        An `int` representing the most kills in a game.
-        """
-        return self._most_kill
-    
-    @property
-    def max_kill(self) -> int:
-        """
-        An `int` representing the max kills in a game.
-        """
-        return self._max_kill
-    
-    @property
-    def max_death(self) -> int:
-        """
-        An `int` representing the max deaths in a game.
-        """
-        return self._max_death
-    
-    @property
-    def double_kill(self) -> int:
-        """
-        An `int` representing the number of double kills.
-        """
-        return self._double_kill
-    
-    @property
-    def triple_kill(self) -> int:
-        """
-        An `int` representing the number of triple kills.
-        """
-        return self._triple_kill
-    
-    @property
-    def quadra_kill(self) -> int:
-        """
-        An `int` representing the number of quadra kills.
-        """
-        return self._quadra_kill
-    
-    @property
-    def penta_kill(self) -> int:
-        """
-        An `int` representing the number of penta kills.
-        """
-        return self._penta_kill
-    
-    @property
-    def game_length_second(self) -> int:
-        """
-        An `int` representing the total game length in seconds.
-        """
-        return self._game_length_second
-    
-    @property
-    def kda(self) -> float:
-        """
-        A `float` representing the KDA of the champion.
-        """
-        return (self._kill + self._assist) / self._death if self._death != 0 else 0
+    champion: Champion
+    id: int
+    play: int
+    win: int
+    lose: int
+    kill: int
+    death: int
+    assist: int
+    gold_earned: int
+    minion_kill: int
+    turret_kill: int
+    neutral_minion_kill: int
+    damage_dealt: int
+    damage_taken: int
+    physical_damage_dealt: int
+    magic_damage_dealt: int
+    most_kill: int
+    max_kill: int
+    max_death: int
+    double_kill: int
+    triple_kill: int
+    quadra_kill: int
+    penta_kill: int
+    game_length_second: int
+    inhibitor_kills: int
+    sight_wards_bought_in_game: int
+    vision_wards_bought_in_game: int
+    vision_score: int
+    wards_placed: int
+    wards_killed: int
+    heal: int
+    time_ccing_others: int
+    op_score: int
+    is_max_in_team_op_score: int
+    physical_damage_taken: int
+    damage_dealt_to_champions: int
+    physical_damage_dealt_to_champions: int
+    magic_damage_dealt_to_champions: int
+    damage_dealt_to_objectives: int
+    damage_dealt_to_turrets: int
+    damage_self_mitigated: int
+    max_largest_multi_kill: int
+    max_largest_critical_strike: int
+    max_largest_killing_spree: int
+    snowball_throws: int
+    snowball_hits: int
+    kda: float = field(init=False, compare=False)
+    _repr: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # kill/death/assist can't change after construction (frozen), so the KDA is computed once here
+        object.__setattr__(self, "kda", ((self.kill or 0) + (self.assist or 0)) / self.death if self.death else 0)
 
     @property
     def win_rate(self) -> float:
         """
         A `float` representing the win rate of the champion.
         """
-        return round(float((self._win / self._play) * 100), 2) if self._play != 0 else 0
+        return round(float((self.win / self.play) * 100), 2) if self.play != 0 else 0
 
-    @property
-    def inhibitor_kills(self) -> int:
-        """
-        An `int` representing the number of inhibitor kills.
-        """
-        return self._inhibitor_kills
+    def __repr__(self) -> str:
+        if self._repr is None:
+            object.__setattr__(
+                self,
+                "_repr",
+                f"ChampionStats(champion={self.champion}, win={self.win} / lose={self.lose} (winrate: {self.win_rate}%), kda={round(self.kda, 2)})",
+            )
+        return self._repr
 
-    @property
-    def sight_wards_bought_in_game(self) -> int:
-        """
-        An `int` representing the number of sight wards bought in game.
-        """
-        return self._sight_wards_bought_in_game
 
-    @property
-    def vision_wards_bought_in_game(self) -> int:
-        """
-        An `int` representing the number of vision wards bought in game.
-        """
-        return self._vision_wards_bought_in_game
+class ChampionStatsTable(_ColumnTable, row_type=ChampionStats):
+    """
+    Column-oriented (struct of arrays) store for many `ChampionStats` rows.\n
+    On top of the integer stat columns, kda is kept in an `array("d")` and the champion of each row in `champions`,
+    e.g. `sum(table["penta_kill"])`, `max(table["kda"])` or `table.top("kda", 3)`.\n
 
-    @property
-    def vision_score(self) -> int:
-        """
-        An `int` representing the vision score.
-        """
-        return self._vision_score
+    ### Properties:
+        `champions: list[Champion]` - Champion object for each row\n
+        `columns: dict[str, array]` - Mapping of stat name to its column\n
+    """
 
-    @property
-    def wards_placed(self) -> int:
-        """
-        An `int` representing the number of wards placed.
-        """
-        return self._wards_placed
+    def __init__(self) -> None:
+        super().__init__()
+        self.champions: list[Champion] = []
+        self.columns["kda"] = array("d")
 
-    @property
-    def wards_killed(self) -> int:
-        """
-        An `int` representing the number of wards killed.
+    @classmethod
+    def from_stats(cls, stats: list[ChampionStats]) -> "ChampionStatsTable":
         """
-        return self._wards_killed
+        Build a table from a list of `ChampionStats` objects.
 
-    @property
-    def heal(self) -> int:
-        """
-        An `int` representing the amount of healing done.
-        """
-        return self._heal
+        ### Args:
+            stats : `list[ChampionStats]`
+                The champion stats to store, one row each.
 
-    @property
-    def time_ccing_others(self) -> int:
+        ### Returns:
+            `ChampionStatsTable` : The populated table.
         """
-        An `int` representing the time spent crowd-controlling others.
-        """
-        return self._time_ccing_others
+        stats = list(stats)
+        table = super().from_stats(stats)
+        table.champions.extend(champion_stats.champion for champion_stats in stats)
+        table.columns["kda"].extend(champion_stats.kda for champion_stats in stats)
 
-    @property
-    def op_score(self) -> int:
-        """
-        An `int` representing the OP score.
-        """
-        return self._op_score
+        return table
 
-    @property
-    def is_max_in_team_op_score(self) -> bool:
-        """
-        A `bool` indicating if the player has the maximum OP score in the team.
+    @classmethod
+    def from_api(cls, rows: list[dict], champions_by_id: dict[int, Champion] | None = None) -> "ChampionStatsTable":
         """
-        return self._is_max_in_team_op_score
+        Build a table straight from the raw `champion_stats` dicts returned by the OPGG API,
+        without creating a `ChampionStats` object per row.
 
-    @property
-    def physical_damage_taken(self) -> int:
-        """
-        An `int` representing the physical damage taken.
-        """
-        return self._physical_damage_taken
+        ### Args:
+            rows : `list[dict]`
+                The raw champion stats, as found under `summoner.most_champions.champion_stats`.
 
-    @property
-    def damage_dealt_to_champions(self) -> int:
-        """
-        An `int` representing the total damage dealt to champions.
-        """
-        return self._damage_dealt_to_champions
+            champions_by_id : `dict[int, Champion], optional`
+                Pass a champion id -> `Champion` mapping to fill the `champions` column. Defaults to None.
 
-    @property
-    def physical_damage_dealt_to_champions(self) -> int:
+        ### Returns:
+            `ChampionStatsTable` : The populated table.
         """
-        An `int` representing the physical damage dealt to champions.
-        """
-        return self._physical_damage_dealt_to_champions
+        table = super().from_api(rows)
+        champions_by_id = champions_by_id or {}
+        table.champions.extend(champions_by_id.get(row.get("id")) for row in rows)
 
-    @property
-    def magic_damage_dealt_to_champions(self) -> int:
-        """
-        An `int` representing the magic damage dealt to champions.
-        """
-        return self._magic_damage_dealt_to_champions
+        kill, assist, death = table.columns["kill"], table.columns["assist"], table.columns["death"]
+        table.columns["kda"].extend((k + a) / d if d else 0 for k, a, d in zip(kill, assist, death))
 
-    @property
-    def damage_dealt_to_objectives(self) -> int:
-        """
-        An `int` representing the damage dealt to objectives.
-        """
-        return self._damage_dealt_to_objectives
+        return table
 
-    @property
-    def damage_dealt_to_turrets(self) -> int:
-        """
-        An `int` representing the damage dealt to turrets.
+    def add(self, stats: ChampionStats) -> None:
         """
-        return self._damage_dealt_to_turrets
+        Append a single `ChampionStats` object as a new row.
 
-    @property
-    def damage_self_mitigated(self) -> int:
-        """
-        An `int` representing the damage self mitigated.
+        ### Args:
+            stats : `ChampionStats`
+                The champion stats to append.
         """
-        return self._damage_self_mitigated
+        self.champions.append(stats.champion)
+        for name in self.INT_COLUMNS:
+            self.columns[name].append(getattr(stats, name) or 0)
 
-    @property
-    def max_largest_multi_kill(self) -> int:
-        """
-        An `int` representing the maximum largest multi-kill.
-        """
-        return self._max_largest_multi_kill
+        self.columns["kda"].append(stats.kda)
 
-    @property
-    def max_largest_critical_strike(self) -> int:
-        """
-        An `int` representing the maximum largest critical strike.
+    def top(self, name: str, n: int = 5) -> list[tuple[Champion, int | float]]:
         """
-        return self._max_largest_critical_strike
+        Get the `n` rows with the highest value in a column, e.g. `table.top("kda", 3)`.
 
-    @property
-    def max_largest_killing_spree(self) -> int:
-        """
-        An `int` representing the maximum largest killing spree.
-        """
-        return self._max_largest_killing_spree
+        ### Args:
+            name : `str`
+                The column to rank by.
 
-    @property
-    def snowball_throws(self) -> int:
-        """
-        An `int` representing the number of snowball throws.
-        """
-        return self._snowball_throws
+            n : `int, optional`
+                How many rows to return. Defaults to 5.
 
-    @property
-    def snowball_hits(self) -> int:
-        """
-        An `int` representing the number of snowball hits.
+        ### Returns:
+            `list[tuple[Champion, int | float]]` : (champion, value) pairs, highest value first.
         """
-        return self._snowball_hits
+        column = self.columns[name]
+        best = heapq.nlargest(n, range(len(column)), key=column.__getitem__)
 
-
-    def __repr__(self) -> str:
-        return  f"ChampionStats(champion={self.champion}, win={self.win} / lose={self.lose} (winrate: {self.win_rate}%), kda={round(self.kda, 2)})"
\ No newline at end of file
+        return [(self.champions[i], column[i]) for i in best]
@@ -4,7 +4,12 @@
 # Date    : 2023-07-05
 # License : BSD-3-Clause
 
+from dataclasses import dataclass, fields
 
+from opgg._common import _EMPTY, _ColumnTable
+
+
+@dataclass(slots=True)
 class Stats:
     """
     Represents a player's performance in a game.\n
@@ -49,492 +54,69 @@ class Stats:
         `op_score_timeline_analysis: dict` - Analysis of op score timeline\n
     """
 
-    def __init__(
-        self,
-        champion_level: int,
-        damage_self_mitigated: int,
-        damage_dealt_to_objectives: int,
-        damage_dealt_to_turrets: int,
-        magic_damage_dealt_player: int,
-        physical_damage_taken: int,
-        physical_damage_dealt_to_champions: int,
-        total_damage_taken: int,
-        total_damage_dealt: int,
-        total_damage_dealt_to_champions: int,
-        largest_critical_strike: int,
-        time_ccing_others: int,
-        vision_score: int,
-        vision_wards_bought_in_game: int,
-        sight_wards_bought_in_game: int,
-        ward_kill: int,
-        ward_place: int,
-        turret_kill: int,
-        barrack_kill: int,
-        kill: int,
-        death: int,
-        assist: int,
-        largest_multi_kill: int,
-        largest_killing_spree: int,
-        minion_kill: int,
-        neutral_minion_kill_team_jungle: int,
-        neutral_minion_kill_enemy_jungle: int,
-        neutral_minion_kill: int,
-        gold_earned: int,
-        total_heal: int,
-        result: str,
-        op_score: int,
-        op_score_rank: int,
-        is_opscore_max_in_team: bool,
-        lane_score: int,
-        op_score_timeline: list[dict],
-        op_score_timeline_analysis: dict,
-    ):
-        self._champion_level = champion_level
-        self._damage_self_mitigated = damage_self_mitigated
-        self._damage_dealt_to_objectives = damage_dealt_to_objectives
-        self._damage_dealt_to_turrets = damage_dealt_to_turrets
-        self._magic_damage_dealt_player = magic_damage_dealt_player
-        self._physical_damage_taken = physical_damage_taken
-        self._physical_damage_dealt_to_champions = physical_damage_dealt_to_champions
-        self._total_damage_taken = total_damage_taken
-        self._total_damage_dealt = total_damage_dealt
-        self._total_damage_dealt_to_champions = total_damage_dealt_to_champions
-        self._largest_critical_strike = largest_critical_strike
-        self._time_ccing_others = time_ccing_others
-        self._vision_score = vision_score
-        self._vision_wards_bought_in_game = vision_wards_bought_in_game
-        self._sight_wards_bought_in_game = sight_wards_bought_in_game
-        self._ward_kill = ward_kill
-        self._ward_place = ward_place
-        self._turret_kill = turret_kill
-        self._barrack_kill = barrack_kill
-        self._kill = kill
-        self._death = death
-        self._assist = assist
-        self._largest_multi_kill = largest_multi_kill
-        self._largest_killing_spree = largest_killing_spree
-        self._minion_kill = minion_kill
-        self._neutral_minion_kill_team_jungle = neutral_minion_kill_team_jungle
-        self._neutral_minion_kill_enemy_jungle = neutral_minion_kill_enemy_jungle
-        self._neutral_minion_kill = neutral_minion_kill
-        self._gold_earned = gold_earned
-        self._total_heal = total_heal
-        self._result = result
-        self._op_score = op_score
-        self._op_score_rank = op_score_rank
-        self._is_opscore_max_in_team = is_opscore_max_in_team
-        self._lane_score = lane_score
-        self._op_score_timeline = op_score_timeline
-        self._op_score_timeline_analysis = op_score_timeline_analysis
-
-    @property
-    def champion_level(self) -> int:
-        """
-        A `int` representing the champions level
-        """
-        return self._champion_level
-
-    @champion_level.setter
-    def champion_level(self, value: int):
-        self._champion_level = value
-
-    @property
-    def damage_self_mitigated(self) -> int:
-        """
-        An `int` representing the amount of damage mitigated on self
-        """
-        return self._damage_self_mitigated
-
-    @damage_self_mitigated.setter
-    def damage_self_mitigated(self, value: int):
-        self._damage_self_mitigated = value
-
-    @property
-    def damage_dealt_to_objectives(self) -> int:
-        """
-        A `int` representing the amount of damage dealt to objectives overall
-        """
-        return self._damage_dealt_to_objectives
-
-    @damage_dealt_to_objectives.setter
-    def damage_dealt_to_objectives(self, value: int):
-        self._damage_dealt_to_objectives = value
-
-    @property
-    def damage_dealt_to_turrets(self) -> int:
-        """
-        An `int` representing the amount of damage dealt to turrets specifically
-        """
-        return self._damage_dealt_to_turrets
-
-    @damage_dealt_to_turrets.setter
-    def damage_dealt_to_turrets(self, value: int):
-        self._damage_dealt_to_turrets = value
-
-    @property
-    def magic_damage_dealt_player(self) -> int:
-        """
-        A `int` representing the amount of magic damage dealt to other players
-        """
-        return self._magic_damage_dealt_player
-
-    @magic_damage_dealt_player.setter
-    def magic_damage_dealt_player(self, value: int):
-        self._magic_damage_dealt_player = value
-
-    @property
-    def physical_damage_taken(self) -> int:
-        """
-        An `int` representing the amount of physical damage taken
-        """
-        return self._physical_damage_taken
-
-    @physical_damage_taken.setter
-    def physical_damage_taken(self, value: int):
-        self._physical_damage_taken = value
-
-    @property
-    def physical_damage_dealt_to_champions(self) -> int:
-        """
-        A `int` representing the amount of physical damage dealt to other players
-        """
-        return self._physical_damage_dealt_to_champions
-
-    @physical_damage_dealt_to_champions.setter
-    def physical_damage_dealt_to_champions(self, value: int):
-        self._physical_damage_dealt_to_champions = value
-
-    @property
-    def total_damage_taken(self) -> int:
-        """
-        An `int` representing the amount of damage taken in total
-        """
-        return self._total_damage_taken
-
-    @total_damage_taken.setter
-    def total_damage_taken(self, value: int):
-        self._total_damage_taken = value
-
-    @property
-    def total_damage_dealt(self) -> int:
-        """
-        A `int` representing the amount of damage dealt in total
-        """
-        return self._total_damage_dealt
-
-    @total_damage_dealt.setter
-    def total_damage_dealt(self, value: int):
-        self._total_damage_dealt = value
-
-    @property
-    def total_damage_dealt_to_champions(self) -> int:
-        """
-        An `int` representing the amount of damage dealt to other champions in total
-        """
-        return self._total_damage_dealt_to_champions
-
-    @total_damage_dealt_to_champions.setter
-    def total_damage_dealt_to_champions(self, value: int):
-        self._total_damage_dealt_to_champions = value
-
-    @property
-    def largest_critical_strike(self) -> int:
-        """
-        A `int` representing the largest critical strike
-        """
-        return self._largest_critical_strike
-
-    @largest_critical_strike.setter
-    def largest_critical_strike(self, value: int):
-        self._largest_critical_strike = value
-
-    @property
-    def time_ccing_others(self) -> int:
-        """
-        An `int` representing the amount of time cc'ing (crowd controlling) others
-        """
-        return self._time_ccing_others
-
-    @time_ccing_others.setter
-    def time_ccing_others(self, value: int):
-        self._time_ccing_others = value
-
-    @property
-    def vision_score(self) -> int:
-        """
-        A `int` representing the vision score
-        """
-        return self._vision_score
-
-    @vision_score.setter
-    def vision_score(self, value: int):
-        self._vision_score = value
-
-    @property
-    def vision_wards_bought_in_game(self) -> int:
-        """
-        An `int` representing the amount of vision wards bought in the game
-        """
-        return self._vision_wards_bought_in_game
-
-    @vision_wards_bought_in_game.setter
-    def vision_wards_bought_in_game(self, value: int):
-        self._vision_wards_bought_in_game = value
-
-    @property
-    def sight_wards_bought_in_game(self) -> int:
-        """
-        A `int` representing the amount of sight wards bought in the game
-        """
-        return self._sight_wards_bought_in_game
-
-    @sight_wards_bought_in_game.setter
-    def sight_wards_bought_in_game(self, value: int):
-        self._sight_wards_bought_in_game = value
-
-    @property
-    def ward_kill(self) -> int:
-        """
-        A `int` representing the number of wards killed
-        """
-        return self._ward_kill
-
-    @ward_kill.setter
-    def ward_kill(self, value: int):
-        self._ward_kill = value
-
-    @property
-    def ward_place(self) -> int:
-        """
-        An `int` representing the number of wards placed
-        """
-        return self._ward_place
-
-    @ward_place.setter
-    def ward_place(self, value: int):
-        self._ward_place = value
-
-    @property
-    def turret_kill(self) -> int:
-        """
-        An `int` representing the amount of turrets killed
-        """
-        return self._turret_kill
-
-    @turret_kill.setter
-    def turret_kill(self, value: int):
-        self._turret_kill = value
-
-    @property
-    def barrack_kill(self) -> int:
-        """
-        An `int` representing the amount of inhibitor kills
-        """
-        return self._barrack_kill
-
-    @barrack_kill.setter
-    def barrack_kill(self, value: int):
-        self._barrack_kill = value
-
-    @property
-    def kill(self) -> int:
-        """
-        An `int` representing the amount of kills
-        """
-        return self._kill
-
-    @kill.setter
-    def kill(self, value: int):
-        self._kill = value
-
-    @property
-    def death(self) -> int:
-        """
-        An `int` representing the amount of death
-        """
-        return self._death
-
-    @death.setter
-    def death(self, value: int):
-        self._death = value
-
-    @property
-    def assist(self) -> int:
-        """
-        An `int` representing the amount of assist
-        """
-        return self._assist
-
-    @assist.setter
-    def assist(self, value: int):
-        self._assist = value
-
-    @property
-    def largest_multi_kill(self) -> int:
-        """
-        An `int` representing the largest amount of multi-kills
-        """
-        return self._largest_multi_kill
-
-    @largest_multi_kill.setter
-    def largest_multi_kill(self, value: int):
-        self._largest_multi_kill = value
-
-    @property
-    def largest_killing_spree(self) -> int:
-        """
-        An `int` representing the largest killing spree
-        """
-        return self._largest_killing_spree
-
-    @largest_killing_spree.setter
-    def largest_killing_spree(self, value: int):
-        self._largest_killing_spree = value
-
-    @property
-    def minion_kill(self) -> int:
-        """
-        An `int` representing the amount of minions killed
-        """
-        return self._minion_kill
-
-    @minion_kill.setter
-    def minion_kill(self, value: int):
-        self._minion_kill = value
-
-    @property
-    def neutral_minion_kill_team_jungle(self) -> int:
-        """
-        An `int` representing the amount of neutral jungle mobs killed in team jungle
-        """
-        return self._neutral_minion_kill_team_jungle
-
-    @neutral_minion_kill_team_jungle.setter
-    def neutral_minion_kill_team_jungle(self, value: int):
-        self._neutral_minion_kill_team_jungle = value
-
-    @property
-    def neutral_minion_kill_enemy_jungle(self) -> int:
-        """
-        An `int` representing the amount of neutral jungle mobs killed in enemy jungle
-        """
-        return self._neutral_minion_kill_enemy_jungle
-
-    @neutral_minion_kill_enemy_jungle.setter
-    def neutral_minion_kill_enemy_jungle(self, value: int):
-        self._neutral_minion_kill_enemy_jungle = value
-
-    @property
-    def neutral_minion_kill(self) -> int:
-        """
-        An `int` representing the amount of neutral minion kills
-        """
-        return self._neutral_minion_kill
-
-    @neutral_minion_kill.setter
-    def neutral_minion_kill(self, value: int):
-        self._neutral_minion_kill = value
-
-    @property
-    def gold_earned(self) -> int:
-        """
-        An `int` representing the amount of gold earned
-        """
-        return self._gold_earned
-
-    @gold_earned.setter
-    def gold_earned(self, value: int):
-        self._gold_earned = value
-
-    @property
-    def total_heal(self) -> int:
-        """
-        An `int` representing the total amount healed
-        """
-        return self._total_heal
-
-    @total_heal.setter
-    def total_heal(self, value: int):
-        self._total_heal = value
-
-    @property
-    def result(self) -> str:
-        """
-        An `str` representing the result of the match (WIN / LOSE)
-        """
-        return self._result
-
-    @result.setter
-    def result(self, value: str):
-        self._result = value
-
-    @property
-    def op_score(self) -> int:
-        """
-        An `int` representing your op score
-        """
-        return self._op_score
-
-    @op_score.setter
-    def op_score(self, value: int):
-        self._op_score = value
-
-    @property
-    def op_score_rank(self) -> int:
-        """
-        An `int` representing how your op score stacked up amongst your team (1-10)
-        """
-        return self._op_score_rank
-
-    @op_score_rank.setter
-    def op_score_rank(self, value: int):
-        self._op_score_rank = value
-
-    @property
-    def is_opscore_max_in_team(self) -> bool:
-        """
-        An `bool` representing whether or not you had the highest op score amongst your team
-        """
-        return self._is_opscore_max_in_team
-
-    @is_opscore_max_in_team.setter
-    def is_opscore_max_in_team(self, value: bool):
-        self._is_opscore_max_in_team = value
-
-    @property
-    def lane_score(self) -> int:
-        """
-        An `int` representing your lane score
-        """
-        return self._lane_score
-
-    @lane_score.setter
-    def lane_score(self, value: int):
-        self._lane_score = value
-
-    @property
-    def op_score_timeline(self) -> list[dict[str, float]]:
-        """
-        An `list[dict[str, float]]` representing your op score as the game progresses. Data points are provided every 60 seconds.
-        """
-        return self._op_score_timeline
-
-    @op_score_timeline.setter
-    def op_score_timeline(self, value: list[dict[str, float]]):
-        self._op_score_timeline = value
-
-    @property
-    def op_score_timeline_analysis(self) -> dict[str, str]:
-        """
-        An `dict[str, str]` representing the timeline analysis
-        """
-        return self._op_score_timeline_analysis
+    champion_level: int
+    damage_self_mitigated: int
+    damage_dealt_to_objectives: int
+    damage_dealt_to_turrets: int
+    magic_damage_dealt_player: int
+    physical_damage_taken: int
+    physical_damage_dealt_to_champions: int
+    total_damage_taken: int
+    total_damage_dealt: int
+    total_damage_dealt_to_champions: int
+    largest_critical_strike: int
+    time_ccing_others: int
+    vision_score: int
+    vision_wards_bought_in_game: int
+    sight_wards_bought_in_game: int
+    ward_kill: int
+    ward_place: int
+    turret_kill: int
+    barrack_kill: int
+    kill: int
+    death: int
+    assist: int
+    largest_multi_kill: int
+    largest_killing_spree: int
+    minion_kill: int
+    neutral_minion_kill_team_jungle: int
+    neutral_minion_kill_enemy_jungle: int
+    neutral_minion_kill: int
+    gold_earned: int
+    total_heal: int
+    result: str
+    op_score: int
+    op_score_rank: int
+    is_opscore_max_in_team: bool
+    lane_score: int
+    op_score_timeline: list[dict]
+    op_score_timeline_analysis: dict
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Stats":
+        """
+        Build a `Stats` object from a participant's raw `stats` dict returned by OPGG.
+        """
+        # every field maps 1:1 onto a key of the same name, so they're passed positionally in declaration order
+        return cls(*map(data.get, _STATS_FIELDS))
+
+
+# field names of Stats, looked up once rather than per participant
+_STATS_FIELDS = tuple(f.name for f in fields(Stats))
+
+
+class StatsTable(_ColumnTable, row_type=Stats):
+    """
+    Column-oriented (struct of arrays) store for many participants' `Stats`.\n
+    Build one with `StatsTable.from_stats(stats)` or straight from the raw stats dicts with `StatsTable.from_api(rows)`,
+    e.g. `sum(table["total_damage_dealt_to_champions"]) / len(table)`.\n
 
-    @op_score_timeline_analysis.setter
-    def op_score_timeline_analysis(self, value: dict[str, str]):
-        self._op_score_timeline_analysis = value
+    ### Properties:
+        `columns: dict[str, array]` - Mapping of stat name to its column\n
+    """
 
 
+@dataclass(slots=True)
 class GameStats:
     """
     Represents a player's game performance metrics.\n
@@ -562,271 +144,39 @@ class GameStats:
         `kill: int` - Number of kills\n
     """
 
-    def __init__(
-        self,
-        is_win: bool,
-        champion_kill: int,
-        champion_first: bool,
-        inhibitor_kill: int,
-        inhibitor_first: bool,
-        rift_herald_kill: int,
-        rift_herald_first: bool,
-        dragon_kill: int,
-        dragon_first: bool,
-        baron_kill: int,
-        baron_first: bool,
-        tower_kill: int,
-        tower_first: bool,
-        horde_kill: int,
-        horde_first: bool,
-        is_remake: bool,
-        death: int,
-        assist: int,
-        gold_earned: int,
-        kill: int,
-    ):
-        self._is_win = is_win
-        self._champion_kill = champion_kill
-        self._champion_first = champion_first
-        self._inhibitor_kill = inhibitor_kill
-        self._inhibitor_first = inhibitor_first
-        self._rift_herald_kill = rift_herald_kill
-        self._rift_herald_first = rift_herald_first
-        self._dragon_kill = dragon_kill
-        self._dragon_first = dragon_first
-        self._baron_kill = baron_kill
-        self._baron_first = baron_first
-        self._tower_kill = tower_kill
-        self._tower_first = tower_first
-        self._horde_kill = horde_kill
-        self._horde_first = horde_first
-        self._is_remake = is_remake
-        self._death = death
-        self._assist = assist
-        self._gold_earned = gold_earned
-        self._kill = kill
-
-    @property
-    def is_win(self) -> bool:
-        """
-        A `bool` representing the game result
-        """
-        return self._is_win
-
-    @is_win.setter
-    def is_win(self, value: bool):
-        self._is_win = value
-
-    @property
-    def champion_kill(self) -> int:
-        """
-        An `int` representing the number of champions killed
-        """
-        return self._champion_kill
-
-    @champion_kill.setter
-    def champion_kill(self, value: int):
-        self._champion_kill = value
-
-    @property
-    def champion_first(self) -> bool:
-        """
-        A `bool` representing if team got first champion kill
-        """
-        return self._champion_first
-
-    @champion_first.setter
-    def champion_first(self, value: bool):
-        self._champion_first = value
-
-    @property
-    def inhibitor_kill(self) -> int:
-        """
-        An `int` representing the number of inhibitors killed
-        """
-        return self._inhibitor_kill
-
-    @inhibitor_kill.setter
-    def inhibitor_kill(self, value: int):
-        self._inhibitor_kill = value
-
-    @property
-    def inhibitor_first(self) -> bool:
-        """
-        A `bool` representing if team got first inhibitor kill
-        """
-        return self._inhibitor_first
-
-    @inhibitor_first.setter
-    def inhibitor_first(self, value: bool):
-        self._inhibitor_first = value
-
-    @property
-    def rift_herald_kill(self) -> int:
-        """
-        An `int` representing the number of rift herald kills
-        """
-        return self._rift_herald_kill
-
-    @rift_herald_kill.setter
-    def rift_herald_kill(self, value: int):
-        self._rift_herald_kill = value
-
-    @property
-    def rift_herald_first(self) -> bool:
-        """
-        A `bool` representing if team got first rift herald kill
-        """
-        return self._rift_herald_first
-
-    @rift_herald_first.setter
-    def rift_herald_first(self, value: bool):
-        self._rift_herald_first = value
-
-    @property
-    def dragon_kill(self) -> int:
-        """
-        An `int` representing the number of dragon kills
-        """
-        return self._dragon_kill
-
-    @dragon_kill.setter
-    def dragon_kill(self, value: int):
-        self._dragon_kill = value
-
-    @property
-    def dragon_first(self) -> bool:
-        """
-        A `bool` representing if team got first dragon
-        """
-        return self._dragon_first
-
-    @dragon_first.setter
-    def dragon_first(self, value: bool):
-        self._dragon_first = value
-
-    @property
-    def baron_kill(self) -> int:
-        """
-        An `int` representing the number of baron kills
-        """
-        return self._baron_kill
-
-    @baron_kill.setter
-    def baron_kill(self, value: int):
-        self._baron_kill = value
+    is_win: bool
+    champion_kill: int
+    champion_first: bool
+    inhibitor_kill: int
+    inhibitor_first: bool
+    rift_herald_kill: int
+    rift_herald_first: bool
+    dragon_kill: int
+    dragon_first: bool
+    baron_kill: int
+    baron_first: bool
+    tower_kill: int
+    tower_first: bool
+    horde_kill: int
+    horde_first: bool
+    is_remake: bool
+    death: int
+    assist: int
+    gold_earned: int
+    kill: int
 
-    @property
-    def baron_first(self) -> bool:
+    @classmethod
+    def from_api(cls, data: dict) -> "GameStats":
         """
-        A `bool` representing if team got first baron kill
+        Build a `GameStats` object from a team's raw `game_stat` dict returned by OPGG.
         """
-        return self._baron_first
+        return cls(*map(data.get, _GAME_STATS_FIELDS))
 
-    @baron_first.setter
-    def baron_first(self, value: bool):
-        self._baron_first = value
 
-    @property
-    def tower_kill(self) -> int:
-        """
-        An `int` representing the number of tower kills
-        """
-        return self._tower_kill
-
-    @tower_kill.setter
-    def tower_kill(self, value: int):
-        self._tower_kill = value
-
-    @property
-    def tower_first(self) -> bool:
-        """
-        A `bool` representing if team got first tower kill
-        """
-        return self._tower_first
-
-    @tower_first.setter
-    def tower_first(self, value: bool):
-        self._tower_first = value
-
-    @property
-    def horde_kill(self) -> int:
-        """
-        An `int` representing the number of void grub kills
-        """
-        return self._horde_kill
-
-    @horde_kill.setter
-    def horde_kill(self, value: int):
-        self._horde_kill = value
-
-    @property
-    def horde_first(self) -> bool:
-        """
-        A `bool` representing if team got first void grub kill
-        """
-        return self._horde_first
-
-    @horde_first.setter
-    def horde_first(self, value: bool):
-        self._horde_first = value
-
-    @property
-    def is_remake(self) -> bool:
-        """
-        A `bool` representing if game was a remake
-        """
-        return self._is_remake
-
-    @is_remake.setter
-    def is_remake(self, value: bool):
-        self._is_remake = value
-
-    @property
-    def death(self) -> int:
-        """
-        An `int` representing the total amount of deaths for the team
-        """
-        return self._death
-
-    @death.setter
-    def death(self, value: int):
-        self._death = value
-
-    @property
-    def assist(self) -> int:
-        """
-        An `int` representing the total amount of assists for the team
-        """
-        return self._assist
-
-    @assist.setter
-    def assist(self, value: int):
-        self._assist = value
-
-    @property
-    def gold_earned(self) -> int:
-        """
-        An `int` representing the total amount of gold earned for the team
-        """
-        return self._gold_earned
-
-    @gold_earned.setter
-    def gold_earned(self, value: int):
-        self._gold_earned = value
-
-    @property
-    def kill(self) -> int:
-        """
-        An `int` representing the total amount of kills for the team
-        """
-        return self._kill
-
-    @kill.setter
-    def kill(self, value: int):
-        self._kill = value
+_GAME_STATS_FIELDS = tuple(f.name for f in fields(GameStats))
 
 
+@dataclass(slots=True)
 class Team:
     """
     Represents a game's summary including key statistics and banned champions.\n
@@ -837,40 +187,13 @@ class Team:
         `banned_champions: list` - List of banned champions in the game\n
     """
 
-    def __init__(self, key: str, game_stat: GameStats, banned_champions: list):
-        self._key = key
-        self._game_stat = game_stat
-        self._banned_champions = banned_champions
-
-    @property
-    def key(self) -> str:
-        """
-        A `str` representing the team key (BLUE, RED, etc.)
-        """
-        return self._key
-
-    @key.setter
-    def key(self, value: str):
-        self._key = value
+    key: str
+    game_stat: GameStats
+    banned_champions: list
 
-    @property
-    def game_stat(self) -> GameStats:
+    @classmethod
+    def from_api(cls, data: dict) -> "Team":
         """
-        A `GameStats` object representing all game specific stats
+        Build a `Team` from a raw team dict returned by OPGG. (An entry of a game's `teams`)
         """
-        return self._game_stat
-
-    @game_stat.setter
-    def game_stat(self, value: GameStats):
-        self._game_stat = value
-
-    @property
-    def banned_champions(self) -> list:
-        """
-        A `list` of champion ids that were banned
-        """
-        return self._banned_champions
-
-    @banned_champions.setter
-    def banned_champions(self, value: list):
-        self._banned_champions = value
+        return cls(data["key"], GameStats.from_api(data.get("game_stat") or _EMPTY), data.get("banned_champions"))
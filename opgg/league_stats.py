@@ -4,9 +4,13 @@
 # Date    : 2023-07-05
 # License : BSD-3-Clause
 
+from dataclasses import dataclass, fields
 from datetime import datetime
 
+from opgg._common import _EMPTY
 
+
+@dataclass(slots=True)
 class Tier:
     """
     Represents a tier in a league.\n
@@ -20,92 +24,40 @@ class Tier:
         `border_image_url: str` - URL to the border image. Defaults to None\n
     """
 
-    def __init__(
-        self,
-        tier: str,
-        division: int,
-        tier_image_url: str = None,
-        border_image_url: str = None,
-        lp: int = None,
-        level: int = None,
-    ):
-        self._tier = tier if tier is not None else "UNRANKED"
-        self._division = division if division is not None else 0
-        self._lp = lp if lp is not None else 0
-        self._level = level if level is not None else 0
-        self._tier_image_url = tier_image_url
-        self._border_image_url = border_image_url
-
-    @property
-    def tier(self) -> str:
-        """
-        A `str` representing the tier (e.g. "Silver")
-        """
-        return self._tier
-
-    @tier.setter
-    def tier(self, value: str):
-        self._tier = value
-
-    @property
-    def division(self) -> int:
-        """
-        An `int` representing the division
-        """
-        return self._division
-
-    @division.setter
-    def division(self, value: int):
-        self._division = value
-
-    @property
-    def lp(self) -> int:
-        """
-        An `int` representing the league points
-        """
-        return self._lp
-
-    @lp.setter
-    def lp(self, value: int):
-        self._lp = value
-
-    @property
-    def level(self) -> int:
-        """
-        An `int` representing an unknown level value
-        """
-        return self._level
+    tier: str
+    division: int
+    tier_image_url: str = None
+    border_image_url: str = None
+    lp: int = None
+    level: int = None
 
-    @level.setter
-    def level(self, value: int):
-        self._level = value
+    def __post_init__(self) -> None:
+        # OPGG sends nulls for unranked entries
+        if self.tier is None:
+            self.tier = "UNRANKED"
+        if self.division is None:
+            self.division = 0
+        if self.lp is None:
+            self.lp = 0
+        if self.level is None:
+            self.level = 0
 
-    @property
-    def tier_image_url(self) -> str:
+    @classmethod
+    def from_api(cls, data: dict | None) -> "Tier":
         """
-        A `str` representing the URL to the tier image
+        Build a `Tier` from a raw tier dict returned by OPGG (`tier_info`, `rank_info`, ...). None is treated as unranked.
         """
-        return self._tier_image_url
+        # fields are named after the api keys, so they can be passed positionally in declaration order
+        return cls(*map((data or _EMPTY).get, _TIER_FIELDS))
 
-    @tier_image_url.setter
-    def tier_image_url(self, value: str):
-        self._tier_image_url = value
-
-    @property
-    def border_image_url(self) -> str:
-        """
-        A `str` representing the URL to the border image
-        """
-        return self._border_image_url
+    def __repr__(self) -> str:
+        return f"Tier(tier={self.tier}, division={self.division}, lp={self.lp})"
 
-    @border_image_url.setter
-    def border_image_url(self, value: str):
-        self._border_image_url = value
 
-    def __repr__(self) -> str:
-        return f"Tier(tier={self._tier}, division={self._division}, lp={self._lp})"
+_TIER_FIELDS = tuple(f.name for f in fields(Tier))
 
 
+@dataclass(slots=True)
 class QueueInfo:
     """
     Represents a queue in a league.\n
@@ -116,43 +68,17 @@ class QueueInfo:
         `game_type: str` - Queue/Game type\n
     """
 
-    def __init__(self, id: int, queue_translate: str, game_type: str):
-        self._id = id
-        self._queue_translate = queue_translate
-        self._game_type = game_type
+    id: int
+    queue_translate: str
+    game_type: str
 
-    @property
-    def id(self) -> int:
+    @classmethod
+    def from_api(cls, data: dict | None) -> "QueueInfo":
         """
-        An `int` representing the queue ID
+        Build a `QueueInfo` from a raw `queue_info` dict returned by OPGG.
         """
-        return self._id
-
-    @id.setter
-    def id(self, value: int):
-        self._id = value
-
-    @property
-    def queue_translate(self) -> str:
-        """
-        A `str` representing the queue/game type in KOREAN
-        """
-        return self._queue_translate
-
-    @queue_translate.setter
-    def queue_translate(self, value: str):
-        self._queue_translate = value
-
-    @property
-    def game_type(self) -> str:
-        """
-        A `str` representing the queue/game type
-        """
-        return self._game_type
-
-    @game_type.setter
-    def game_type(self, value: str):
-        self._game_type = value
+        data = data or _EMPTY
+        return cls(data.get("id"), data.get("queue_translate"), data.get("game_type"))
 
     def __repr__(self) -> str:
         return f"QueueInfo(game_type={self.game_type})"
@@ -7,28 +7,49 @@
 # fmt: off
 import os
 import sys
-import json
 import logging
-import traceback
-from typing import Literal
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Literal
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from datetime import datetime
-from json import JSONDecodeError
-
-import requests
-from fake_useragent import UserAgent
 
+from opgg._common import _EMPTY, _loads
 from opgg.cacher import Cacher
 from opgg.params import Region
-from opgg.game import GameStats, Stats, Team
 from opgg.champion import ChampionStats, Champion
 from opgg.season import RankEntry, Season, SeasonInfo
-from opgg.summoner import Game, Participant, Summoner
+from opgg.summoner import Game, Summoner
 from opgg.league_stats import LeagueStats, Tier, QueueInfo
-from opgg.utils import get_page_props, get_all_seasons, get_all_champions
+
+# requests and fake_useragent are imported on first use (OPGG()), and utils (which sets up its own session)
+# on first search(), so importing this module for its types doesn't pay for them
+if TYPE_CHECKING:
+    import requests
+    from fake_useragent import UserAgent
 
 
 # fmt: on
 
+# ciso8601 is optional as well, a C ISO-8601 parser for the created_at timestamps
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    _parse_dt = datetime.fromisoformat
+
+# runs the /games request alongside the /summary request in get_summoner(). shared by every OPGG object,
+# its threads are only started when first needed
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="OPGG.py")
+
+# built recent games are reused for a short while only, and only for the most recently used summoners
+_GAMES_CACHE_TTL = 120  # seconds
+_GAMES_CACHE_MAXSIZE = 32
+
+# every ChampionStats field except the champion object maps 1:1 onto a key of OPGG's champion_stats dicts
+_CHAMPION_STATS_FIELDS = tuple(f.name for f in fields(ChampionStats) if f.init and f.name != "champion")
+
 
 class OPGG:
     """
@@ -44,6 +65,12 @@ class OPGG:
 
     cached_page_props = None
 
+    # fake_useragent loads its whole UA database on construction, so one instance is shared by every OPGG object
+    _ua: "UserAgent | None" = None
+
+    # logging/log dir setup (and the empty log sweep) only needs to happen once per process
+    _logging_initialized = False
+
     # Todo: Add support for the following endpoint(s):
     # https://op.gg/api/v1.0/internal/bypass/games/na/summoners/<summoner_id?>/?&limit=20&hl=en_US&game_type=total
 
@@ -61,32 +88,72 @@ class OPGG:
         self._api_url = f"{self._base_api_url}/summoners/{self.region}/{self.summoner_id}/summary"
         self._games_api_url = f"{self._base_api_url}/games/{self.region}/summoners/{self.summoner_id}"
 
-        self._ua = UserAgent()
-        self._headers = {"User-Agent": self._ua.random}
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        if OPGG._ua is None:
+            from fake_useragent import UserAgent
+
+            OPGG._ua = UserAgent()
+
+        self._headers = {"User-Agent": OPGG._ua.random}
+
+        # one session per instance so every /summary and /games call reuses the same pooled (keep-alive) connections
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+
+        # raise_on_status=False hands the last 5xx response back instead of raising MaxRetryError,
+        # so callers still see a status code like they did before retries were added
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
         self._all_champions = None
         self._all_seasons = None
 
+        # built recent games, keyed by (games api url, results, game_type) -> (time built, games). see get_recent_games()
+        self._games_cache: OrderedDict[tuple[str, int, str], tuple[float, tuple[Game, ...]]] = OrderedDict()
+        self._games_cache_lock = threading.Lock()
+
+        # (region, summoner id) -> time.monotonic() of the last update() sent through this instance.
+        # cached games built before a renewal are stale, see _get_cached_games()
+        self._renewed_at: dict[tuple[str, str], float] = {}
+
+        # id -> object lookups, kept in sync by the all_champions/all_seasons setters
+        self._champions_by_id: dict[int, Champion] = {}
+        self._seasons_by_id: dict[int, SeasonInfo] = {}
+
         # ===== SETUP START =====
-        logging.root.name = "OPGG.py"
+        if not OPGG._logging_initialized:
+            logging.root.name = "OPGG.py"
 
-        if not os.path.exists("./logs"):
-            logging.info("Creating logs directory...")
-            os.mkdir("./logs")
-        else:
-            # remove empty log files
-            for file in os.listdir("./logs"):
-                if os.stat(f"./logs/{file}").st_size == 0 and file != f'opgg_{datetime.now().strftime("%Y-%m-%d")}.log':
-                    logging.info(f"Removing empty log file: {file}")
-                    os.remove(f"./logs/{file}")
-
-        logging.basicConfig(
-            filename=f'./logs/opgg_{datetime.now().strftime("%Y-%m-%d")}.log',
-            filemode="a+",
-            format="[%(asctime)s][%(name)s->%(module)s:%(lineno)-10d][%(levelname)-7s] : %(message)s",
-            datefmt="%d-%b-%y %H:%M:%S",
-            level=logging.INFO,
-        )
+            log_name = f'opgg_{datetime.now().strftime("%Y-%m-%d")}.log'
+
+            if not os.path.exists("./logs"):
+                logging.info("Creating logs directory...")
+                os.mkdir("./logs")
+            else:
+                # remove empty log files (scandir hands back the dir entries, so no separate listdir + stat per file)
+                with os.scandir("./logs") as entries:
+                    for entry in entries:
+                        if entry.stat().st_size == 0 and entry.name != log_name:
+                            logging.info(f"Removing empty log file: {entry.name}")
+                            os.remove(entry.path)
+
+            logging.basicConfig(
+                filename=f"./logs/{log_name}",
+                filemode="a+",
+                format="[%(asctime)s][%(name)s->%(module)s:%(lineno)-10d][%(levelname)-7s] : %(message)s",
+                datefmt="%d-%b-%y %H:%M:%S",
+                level=logging.INFO,
+            )
+
+            OPGG._logging_initialized = True
         # ===== SETUP END =====
 
         # allow the user to interact with the logger
@@ -159,6 +226,7 @@ class OPGG:
     @headers.setter
     def headers(self, value: dict) -> None:
         self._headers = value
+        self._session.headers.update(value)
 
     @property
     def all_champions(self) -> list[Champion]:
@@ -170,6 +238,7 @@ class OPGG:
     @all_champions.setter
     def all_champions(self, value: list[Champion]) -> None:
         self._all_champions = value
+        self._champions_by_id = {champion.id: champion for champion in value or []}
 
     @property
     def all_seasons(self) -> list[SeasonInfo]:
@@ -181,6 +250,7 @@ class OPGG:
     @all_seasons.setter
     def all_seasons(self, value: list[SeasonInfo]) -> None:
         self._all_seasons = value
+        self._seasons_by_id = {season.id: season for season in value or []}
 
     @property
     def cacher(self) -> Cacher:
@@ -189,6 +259,31 @@ class OPGG:
         """
         return self._cacher
 
+    def close(self) -> None:
+        """
+        Close the instance's HTTP session and its pooled connections.
+
+        Also called when the object is used as a context manager: `with OPGG() as opgg: ...`
+        """
+        self._session.close()
+
+    def __enter__(self) -> "OPGG":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_session(self) -> "requests.Session":
+        """
+        Get the `requests.Session` used for all requests to the OPGG API.
+
+        Mount your own adapters on it to change the retry/pooling behaviour.
+
+        ### Returns:
+            `requests.Session` : The session object.
+        """
+        return self._session
+
     def refresh_api_url(self) -> None:
         """
         A method to refresh the api url with the current summoner id and region.
@@ -200,7 +295,14 @@ class OPGG:
         self.logger.debug(f"self.api_url = {self.api_url}")
         self.logger.debug(f"self._games_api_url = {self._games_api_url}")
 
-    def get_summoner(self, return_content_only=False) -> Summoner | dict:
+    def get_summoner(
+        self,
+        return_content_only=False,
+        summoner_id: str | None = None,
+        region: str | None = None,
+        include_recent_games: bool = True,
+        refresh: bool = False,
+    ) -> Summoner | dict:
         """
         A method to get data from the OPGG API and form a Summoner object.
 
@@ -209,100 +311,116 @@ class OPGG:
             -> Parse data from request (jsonify)\n
             -> Loop through data and form the summoner object.
 
+        ### Args:
+            summoner_id : `str, optional`
+                The summoner id to look up. Defaults to the instance's `summoner_id`.
+
+            region : `str, optional`
+                The region to look in. Defaults to the instance's `region`.
+
+            include_recent_games : `bool, optional`
+                Set to False to skip the /games request when only the profile/league data is needed. Defaults to True.
+
+            refresh : `bool, optional`
+                Skip any cached recent games and query the API again. Defaults to False.
+
         ### Returns:
             `Summoner`: A Summoner object representing the summoner.
         """
-        self.logger.info(f"Sending request to OPGG API... (API_URL = {self.api_url}, HEADERS = {self.headers})")
-        res = requests.get(self.api_url, headers=self.headers)
+        # urls are built locally when an id/region is passed, so concurrent calls don't touch the instance state
+        if summoner_id is None and region is None:
+            api_url = self.api_url
+        else:
+            api_url = (
+                f"{self._base_api_url}/summoners/{region or self.region}/{summoner_id or self.summoner_id}/summary"
+            )
+
+        # /games doesn't depend on the summary, so it's sent first and the two requests overlap.
+        # if the summary turns out to be unusable the future is cancelled, or its result is just dropped
+        recent_games_future = None
+        if include_recent_games and not return_content_only:
+            recent_games_future = _EXECUTOR.submit(
+                self.get_recent_games, summoner_id=summoner_id, region=region, refresh=refresh
+            )
+
+        summary_ok = False
+        try:
+            self.logger.info(f"Sending request to OPGG API... (API_URL = {api_url}, HEADERS = {self.headers})")
+            res = self._session.get(api_url)
+
+            content = None
+            if res.ok:
+                self.logger.info(
+                    f"Request to OPGG API was successful, parsing data (Content Length: {len(res.content)})..."
+                )
+                # res.text decodes the whole body again, only do that if it's actually going to be logged
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"SUMMONER DATA AT /SUMMARY ENDPOINT:\n{res.text}\n")
+                try:
+                    content = _loads(res.content).get("data", [])
+                    # If return_res is passed in func args, return the content
+                    # Required in tests to get all the raw content without building the summoner object
+                    if return_content_only:
+                        return content
+
+                    if not content:
+                        self.logger.error("No data returned from the API.")
+                        return content
+
+                except (TypeError, ValueError):
+                    self.logger.error(f"Failed to decode json data")
+                    # todo: figure out what to return here once i've seen what else this is calling
+                    sys.exit(1)
+
+            else:
+                res.raise_for_status()
+
+            summary_ok = True
+        finally:
+            if not summary_ok and recent_games_future is not None:
+                recent_games_future.cancel()
 
         previous_seasons: list[Season] = []
         league_stats: list[LeagueStats] = []
         most_champions: list[ChampionStats] = []
         recent_game_stats: list[Game] = []
 
-        content = None
-        if res.ok:
-            self.logger.info(f"Request to OPGG API was successful, parsing data (Content Length: {len(res.text)})...")
-            self.logger.debug(f"SUMMONER DATA AT /SUMMARY ENDPOINT:\n{res.text}\n")
-            try:
-                content = json.loads(res.text).get("data", [])
-                # If return_res is passed in func args, return the content
-                # Required in tests to get all the raw content without building the summoner object
-                if return_content_only:
-                    return content
-
-                if not content:
-                    self.logger.error("No data returned from the API.")
-                    return content
-
-            except (TypeError, json.JSONDecodeError):
-                self.logger.error(f"Failed to decode json data")
-                # todo: figure out what to return here once i've seen what else this is calling
-                sys.exit(1)
-
-        else:
-            res.raise_for_status()
+        # everything below reads from the same summoner dict, look it up once
+        summoner_data: dict = content.get("summoner") or _EMPTY
 
         try:
-            for season in content.get("summoner", {}).get("previous_seasons", []):  # type: dict
-                tmp_season_info = None
-                if self.all_seasons:
-                    for _season in self.all_seasons:
-                        if _season.id == season.get("season_id", -1):
-                            tmp_season_info = _season
-                            break
+            parse_dt = _parse_dt
+            for season in summoner_data.get("previous_seasons", []):  # type: dict
+                tmp_season_info = self._seasons_by_id.get(season.get("season_id", -1))
 
                 tmp_rank_entries = []
                 for rank_entry in season.get("rank_entries", []):
-                    if rank_entry.get("rank_info") is None:
+                    rank_info = rank_entry.get("rank_info")
+                    if rank_info is None:
                         continue
 
                     tmp_rank_entries.append(
                         RankEntry(
                             game_type=rank_entry.get("game_type"),
-                            rank_info=Tier(
-                                tier=rank_entry.get("rank_info", {}).get("tier"),
-                                division=rank_entry.get("rank_info", {}).get("division"),
-                                lp=rank_entry.get("rank_info", {}).get("lp"),
-                            ),
-                            created_at=(
-                                datetime.fromisoformat(rank_entry["created_at"]) if rank_entry["created_at"] else None
-                            ),
+                            rank_info=Tier.from_api(rank_info),
+                            created_at=(parse_dt(rank_entry["created_at"]) if rank_entry["created_at"] else None),
                         )
                     )
 
                 previous_seasons.append(
                     Season(
                         season_id=tmp_season_info.id,  # looks like this should have been .id
-                        tier_info=Tier(
-                            tier=season.get("tier_info", {}).get("tier"),
-                            division=season.get("tier_info", {}).get("division"),
-                            lp=season.get("tier_info", {}).get("lp"),
-                            tier_image_url=season.get("tier_info", {}).get("tier_image_url"),
-                            border_image_url=season.get("tier_info", {}).get("border_image_url"),
-                        ),
+                        tier_info=Tier.from_api(season.get("tier_info")),
                         rank_entries=tmp_rank_entries,
-                        created_at=datetime.fromisoformat(season["created_at"]) if season["created_at"] else None,
+                        created_at=parse_dt(season["created_at"]) if season["created_at"] else None,
                     )
                 )
 
-            for league in content.get("summoner", {}).get("league_stats"):
-                tier_info = league.get("tier_info", {})
+            for league in summoner_data.get("league_stats"):
                 league_stats.append(
                     LeagueStats(
-                        queue_info=QueueInfo(
-                            id=league.get("queue_info", {}).get("id"),
-                            queue_translate=league.get("queue_info", {}).get("queue_translate"),
-                            game_type=league.get("queue_info", {}).get("game_type"),
-                        ),
-                        tier_info=Tier(
-                            tier=tier_info.get("tier"),
-                            division=tier_info.get("division"),
-                            lp=tier_info.get("lp"),
-                            tier_image_url=tier_info.get("tier_image_url"),
-                            border_image_url=tier_info.get("border_image_url"),
-                            level=tier_info.get("level"),
-                        ),
+                        queue_info=QueueInfo.from_api(league.get("queue_info")),
+                        tier_info=Tier.from_api(league.get("tier_info")),
                         win=league.get("win"),
                         lose=league.get("lose"),
                         is_hot_streak=league.get("is_hot_streak"),
@@ -314,94 +432,35 @@ class OPGG:
                     )
                 )
 
-            for champion in content.get("summoner", {}).get("most_champions", {}).get("champion_stats", []):
-                tmp_champ = None
-                if self.all_champions:
-                    for _champion in self.all_champions:
-                        if _champion.id == champion.get("id", -1):
-                            tmp_champ = _champion
-                            break
-
-                most_champions.append(
-                    ChampionStats(
-                        champion=tmp_champ,
-                        id=champion.get("id"),
-                        play=champion.get("play"),
-                        win=champion.get("win"),
-                        lose=champion.get("lose"),
-                        kill=champion.get("kill"),
-                        death=champion.get("death"),
-                        assist=champion.get("assist"),
-                        gold_earned=champion.get("gold_earned"),
-                        minion_kill=champion.get("minion_kill"),
-                        turret_kill=champion.get("turret_kill"),
-                        neutral_minion_kill=champion.get("neutral_minion_kill"),
-                        damage_dealt=champion.get("damage_dealt"),
-                        damage_taken=champion.get("damage_taken"),
-                        physical_damage_dealt=champion.get("physical_damage_dealt"),
-                        magic_damage_dealt=champion.get("magic_damage_dealt"),
-                        most_kill=champion.get("most_kill"),
-                        max_kill=champion.get("max_kill"),
-                        max_death=champion.get("max_death"),
-                        double_kill=champion.get("double_kill"),
-                        triple_kill=champion.get("triple_kill"),
-                        quadra_kill=champion.get("quadra_kill"),
-                        penta_kill=champion.get("penta_kill"),
-                        game_length_second=champion.get("game_length_second"),
-                        inhibitor_kills=champion.get("inhibitor_kills"),
-                        sight_wards_bought_in_game=champion.get("sight_wards_bought_in_game"),
-                        vision_wards_bought_in_game=champion.get("vision_wards_bought_in_game"),
-                        vision_score=champion.get("vision_score"),
-                        wards_placed=champion.get("wards_placed"),
-                        wards_killed=champion.get("wards_killed"),
-                        heal=champion.get("heal"),
-                        time_ccing_others=champion.get("time_ccing_others"),
-                        op_score=champion.get("op_score"),
-                        is_max_in_team_op_score=champion.get("is_max_in_team_op_score"),
-                        physical_damage_taken=champion.get("physical_damage_taken"),
-                        damage_dealt_to_champions=champion.get("damage_dealt_to_champions"),
-                        physical_damage_dealt_to_champions=champion.get("physical_damage_dealt_to_champions"),
-                        magic_damage_dealt_to_champions=champion.get("magic_damage_dealt_to_champions"),
-                        damage_dealt_to_objectives=champion.get("damage_dealt_to_objectives"),
-                        damage_dealt_to_turrets=champion.get("damage_dealt_to_turrets"),
-                        damage_self_mitigated=champion.get("damage_self_mitigated"),
-                        max_largest_multi_kill=champion.get("max_largest_multi_kill"),
-                        max_largest_critical_strike=champion.get("max_largest_critical_strike"),
-                        max_largest_killing_spree=champion.get("max_largest_killing_spree"),
-                        snowball_throws=champion.get("snowball_throws"),
-                        snowball_hits=champion.get("snowball_hits"),
-                    )
-                )
+            for champion in (summoner_data.get("most_champions") or _EMPTY).get("champion_stats", []):
+                tmp_champ = self._champions_by_id.get(champion.get("id", -1))
+
+                most_champions.append(ChampionStats(tmp_champ, *map(champion.get, _CHAMPION_STATS_FIELDS)))
 
             # page props did not return any recent games, lets query the /games endpoint instead
-            # gets the summoner id from the objects internal self._game_api_url's self.summoner_id ref
-            recent_game_stats: Game | list[Game] = self.get_recent_games()
+            # (the request was already sent in the background above, this just waits on it)
+            if recent_games_future is not None:
+                recent_game_stats: Game | list[Game] = recent_games_future.result()
 
         except Exception:
-            self.logger.error(
-                f"Error parsing some summoner data... (Could be that they just come in as nulls...): {traceback.format_exc()}"
-            )
+            # logger.exception only formats the traceback if the record is actually emitted
+            self.logger.exception("Error parsing some summoner data... (Could be that they just come in as nulls...)")
 
-        return Summoner(
-            id=content.get("summoner", {}).get("id"),
-            summoner_id=content.get("summoner", {}).get("summoner_id"),
-            acct_id=content.get("summoner", {}).get("acct_id"),
-            puuid=content.get("summoner", {}).get("puuid"),
-            game_name=content.get("summoner", {}).get("game_name"),
-            tagline=content.get("summoner", {}).get("tagline"),
-            name=content.get("summoner", {}).get("name"),
-            internal_name=content.get("summoner", {}).get("internal_name"),
-            profile_image_url=content.get("summoner", {}).get("profile_image_url"),
-            level=content.get("summoner", {}).get("level"),
-            updated_at=content.get("summoner", {}).get("updated_at"),
-            renewable_at=content.get("summoner", {}).get("renewable_at"),
+        return Summoner.from_api(
+            summoner_data,
             previous_seasons=previous_seasons,
             league_stats=league_stats,
             most_champions=most_champions,
             recent_game_stats=recent_game_stats,
         )
 
-    def search(self, summoner_names: str | list[str], region=Region.NA) -> Summoner | list[Summoner] | str:
+    def search(
+        self,
+        summoner_names: str | list[str],
+        region=Region.NA,
+        include_recent_games: bool = True,
+        refresh: bool = False,
+    ) -> Summoner | list[Summoner] | str:
         """
         Search for a single or multiple summoner(s) on OPGG.
 
@@ -412,6 +471,12 @@ class OPGG:
             region : `Region, optional`
                 Pass the region you want to search in. Defaults to "NA".
 
+            include_recent_games : `bool, optional`
+                Set to False to skip fetching each summoner's recent games. Defaults to True.
+
+            refresh : `bool, optional`
+                Skip any cached recent games and query the API again. Defaults to False.
+
         ### Returns:
             `list[Summoner]` | `str` : A single or list of Summoner objects, or a string if no summoner(s) were found.
         """
@@ -446,8 +511,18 @@ class OPGG:
             else:
                 uncached_summoners.append(summoner_name)
 
-        # pass only uncached summoners to get_page_props()
-        page_props = get_page_props(uncached_summoners, region)
+        from opgg.utils import get_page_props, get_all_seasons, get_all_champions
+
+        # Query cache for champs and seasons
+        cached_seasons = self.cacher.get_all_seasons()
+        cached_champions = self.cacher.get_all_champs()
+
+        # pass only uncached summoners to get_page_props().
+        # the scrape is only needed to resolve new summoners or to fill an empty season/champion cache
+        if uncached_summoners or not (cached_seasons and cached_champions):
+            page_props = get_page_props(uncached_summoners, region)
+        else:
+            page_props = {"summoners": []}
 
         self.logger.debug(f"\n********PAGE_PROPS_START********\n{page_props}\n********PAGE_PROPS_STOP********")
 
@@ -461,10 +536,6 @@ class OPGG:
                 f"Cache found for {len(cached_summoner_ids)} summoners: {cached_summoner_ids}, fetching... (using get_summoner() api)"
             )
 
-        # Query cache for champs and seasons
-        cached_seasons = self.cacher.get_all_seasons()
-        cached_champions = self.cacher.get_all_champs()
-
         # If we found some cached seasons/champs, use them, otherwise fetch and cache them.
         if cached_seasons:
             self.all_seasons = cached_seasons
@@ -486,8 +557,8 @@ class OPGG:
 
         # bit of weirdness around generic usernames. If you pass "abc" for example, it will return multiple summoners in the page props.
         # To help, we will check against opgg's "internal_name" property, which seems to be the username.lower() with spaces removed.
-        summoners = []
-        for summoner_name in summoner_names:
+        summoner_ids = []
+        for summoner_name in uncached_summoners:
             # if there are multiple search results for a SINGLE summoner_name, query MUST include the regional identifier
             if len(page_props.get("summoners", [])) > 1 and "#" in summoner_name:
                 logging.debug(f"MULTI-RESULT | page_props->summoners: {page_props.get('summoners')}")
@@ -507,17 +578,34 @@ class OPGG:
             elif len(page_props.get("summoners", [])) == 1:
                 self.summoner_id = page_props["summoners"][0]["summoner_id"]
 
-            summoner = self.get_summoner()
-            summoners.append(summoner)
-            self.logger.info(f"Summoner object built for: {summoner.name} ({summoner.summoner_id}), caching...")
-            self.cacher.insert_summoner(summoner.name, summoner.summoner_id)
+            summoner_ids.append(self.summoner_id)
+
+        # ids resolved from the page props get cached once their summoner object is built
+        resolved_count = len(summoner_ids)
 
         # cached summoners go straight to api
-        for _cached_summoner_id in cached_summoner_ids:
-            self.summoner_id = _cached_summoner_id
-            summoner = self.get_summoner()
-            summoners.append(summoner)
-            self.logger.info(f"Summoner object built for: {summoner.name} ({summoner.summoner_id})")
+        summoner_ids.extend(cached_summoner_ids)
+
+        # every lookup is two independent round trips (/summary + /games), so fetch the summoners concurrently.
+        # the session's connection pool is shared between the workers.
+        def fetch_summoner(summoner_id: str) -> Summoner:
+            return self.get_summoner(
+                summoner_id=summoner_id, region=region, include_recent_games=include_recent_games, refresh=refresh
+            )
+
+        if len(summoner_ids) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(summoner_ids))) as executor:
+                summoners = list(executor.map(fetch_summoner, summoner_ids))
+        else:
+            summoners = [fetch_summoner(_id) for _id in summoner_ids]
+
+        # the cacher's sqlite connection isn't shared across threads, so caching stays on this thread
+        for i, summoner in enumerate(summoners):
+            if i < resolved_count:
+                self.logger.info(f"Summoner object built for: {summoner.name} ({summoner.summoner_id}), caching...")
+                self.cacher.insert_summoner(summoner.name, summoner.summoner_id)
+            else:
+                self.logger.info(f"Summoner object built for: {summoner.name} ({summoner.summoner_id})")
 
         # todo: add custom exceptions instead of this.
         # todo: raise SummonerNotFound exception
@@ -527,26 +615,76 @@ class OPGG:
         return summoners if len(summoners) > 1 else summoners[0]
 
     def get_recent_games(
-        self, results: int = 10, game_type: Literal["total", "ranked", "normal"] = "total", return_content_only=False
+        self,
+        results: int = 10,
+        game_type: Literal["total", "ranked", "normal"] = "total",
+        return_content_only=False,
+        summoner_id: str | None = None,
+        region: str | None = None,
+        refresh: bool = False,
     ) -> list[dict] | list[Game]:
-        recent_games = []
-        res = requests.get(f"{self._games_api_url}?&limit={results}&game_type={game_type}", headers=self.headers)
+        """
+        Get the recent games of a summoner from the OPGG API.
+
+        Built games are kept per summoner/region/results/game_type on the instance for a couple of minutes,
+        so asking again (e.g. right after `get_summoner()`) doesn't send a second identical request.
+        Only the most recently used summoners are kept, and a summoner renewed with `update()` is always refetched.
+
+        ### Args:
+            results : `int, optional`
+                The number of games to get. Defaults to 10.
 
-        self.logger.debug(res.text)
+            game_type : `Literal["total", "ranked", "normal"], optional`
+                The type of games to get. Defaults to "total".
+
+            return_content_only : `bool, optional`
+                Return the raw game dicts instead of `Game` objects (never cached). Defaults to False.
+
+            summoner_id : `str, optional`
+                The summoner id to look up. Defaults to the instance's `summoner_id`.
+
+            region : `str, optional`
+                The region to look in. Defaults to the instance's `region`.
+
+            refresh : `bool, optional`
+                Skip the cached games and query the API again. Defaults to False.
+
+        ### Returns:
+            `list[Game] | list[dict]` : The recent games.
+        """
+        if summoner_id is None and region is None:
+            games_api_url = self._games_api_url
+        else:
+            games_api_url = (
+                f"{self._base_api_url}/games/{region or self.region}/summoners/{summoner_id or self.summoner_id}"
+            )
+
+        # the url already carries the region + summoner id
+        cache_key = (games_api_url, results, game_type)
+        if not return_content_only and not refresh:
+            cached_games = self._get_cached_games(cache_key, summoner_id or self.summoner_id, region or self.region)
+            if cached_games is not None:
+                self.logger.info(f"Using cached recent games for {games_api_url} ({results}, {game_type})")
+                return cached_games
+
+        res = self._session.get(f"{games_api_url}?&limit={results}&game_type={game_type}")
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(res.text)
         game_data = []
         if res.ok:
             self.logger.info(
-                f"Request to OPGG GAME_API was successful, parsing data (Content Length: {len(res.text)})..."
+                f"Request to OPGG GAME_API was successful, parsing data (Content Length: {len(res.content)})..."
             )
             try:
-                game_data: list[dict] = json.loads(res.text).get("data", [])
+                game_data: list[dict] = _loads(res.content).get("data", [])
                 if return_content_only:
                     return game_data
 
                 if not game_data:
                     return game_data
 
-            except (TypeError, JSONDecodeError):
+            except (TypeError, ValueError):
                 self.logger.error(f"Failed to decode json data")
                 # todo: figure out what to return here once i've seen what else this is calling
                 sys.exit(1)
@@ -554,240 +692,96 @@ class OPGG:
         else:
             res.raise_for_status()
 
-        try:
-            for game in game_data:
-                participants = []
-                for participant in game.get("participants", []):
-                    psum = participant.get("summoner", {})
-                    pstats = participant.get("stats", {})
-                    participants.append(
-                        Participant(
-                            summoner=Summoner(
-                                id=psum.get("id"),
-                                summoner_id=psum.get("summoner_id"),
-                                acct_id=psum.get("acct_id"),
-                                puuid=psum.get("puuid"),
-                                game_name=psum.get("game_name"),
-                                tagline=psum.get("tagline"),
-                                name=psum.get("name"),
-                                internal_name=psum.get("internal_name"),
-                                profile_image_url=psum.get("profile_image_url"),
-                                level=psum.get("level"),
-                                updated_at=psum.get("updated_at"),
-                                renewable_at=psum.get("renewable_at"),
-                            ),
-                            participant_id=participant.get("participant_id"),
-                            champion_id=participant.get("champion_id"),
-                            team_key=participant.get("team_key"),
-                            position=participant.get("position"),
-                            role=participant.get("role"),
-                            items=participant.get("items"),
-                            trinket_item=participant.get("trinket_item"),
-                            rune=None,
-                            # rune={
-                            #    participant["rune"]["primary_page_id"],
-                            #    participant["rune"]["primary_rune_id"],
-                            #    participant["rune"]["secondary_page_id"],
-                            # },  # temp, eventually turn this into an object..?
-                            spells=participant.get("spells"),
-                            stats=Stats(
-                                champion_level=pstats.get("champion_level"),
-                                damage_self_mitigated=pstats.get("damage_self_mitigated"),
-                                damage_dealt_to_objectives=pstats.get("damage_dealt_to_objectives"),
-                                damage_dealt_to_turrets=pstats.get("damage_dealt_to_turrets"),
-                                magic_damage_dealt_player=pstats.get("magic_damage_dealt_player"),
-                                physical_damage_taken=pstats.get("physical_damage_taken"),
-                                physical_damage_dealt_to_champions=pstats.get("physical_damage_dealt_to_champions"),
-                                total_damage_taken=pstats.get("total_damage_taken"),
-                                total_damage_dealt=pstats.get("total_damage_dealt"),
-                                total_damage_dealt_to_champions=pstats.get("total_damage_dealt_to_champions"),
-                                largest_critical_strike=pstats.get("largest_critical_strike"),
-                                time_ccing_others=pstats.get("time_ccing_others"),
-                                vision_score=pstats.get("vision_score"),
-                                vision_wards_bought_in_game=pstats.get("vision_wards_bought_in_game"),
-                                sight_wards_bought_in_game=pstats.get("sight_wards_bought_in_game"),
-                                ward_kill=pstats.get("ward_kill"),
-                                ward_place=pstats.get("ward_place"),
-                                turret_kill=pstats.get("champion_level"),
-                                barrack_kill=pstats.get("barrack_kill"),
-                                kill=pstats.get("kill"),
-                                death=pstats.get("death"),
-                                assist=pstats.get("assist"),
-                                largest_multi_kill=pstats.get("largest_multi_kill"),
-                                largest_killing_spree=pstats.get("largest_killing_spree"),
-                                minion_kill=pstats.get("minion_kill"),
-                                neutral_minion_kill_team_jungle=pstats.get("neutral_minion_kill_team_jungle"),
-                                neutral_minion_kill_enemy_jungle=pstats.get("neutral_minion_kill_enemy_jungle"),
-                                neutral_minion_kill=pstats.get("neutral_minion_kill"),
-                                gold_earned=pstats.get("gold_earned"),
-                                total_heal=pstats.get("total_heal"),
-                                result=pstats.get("result"),
-                                op_score=pstats.get("op_score"),
-                                op_score_rank=pstats.get("op_score_rank"),
-                                is_opscore_max_in_team=pstats.get("is_opscore_max_in_team"),
-                                lane_score=pstats.get("lane_score"),
-                                op_score_timeline=pstats.get("op_score_timeline"),
-                                op_score_timeline_analysis=pstats.get("op_score_timeline_analysis"),
-                            ),
-                            tier_info=Tier(
-                                tier=participant.get("tier_info", {}).get("tier"),
-                                division=participant.get("tier_info", {}).get("division"),
-                                lp=participant.get("tier_info", {}).get("lp"),
-                                level=participant.get("tier_info", {}).get("level"),
-                                tier_image_url=participant.get("tier_info", {}).get("tier_image_url"),
-                                border_image_url=participant.get("tier_info", {}).get("border_image_url"),
-                            ),
-                        )
-                    )
+        # building the objects is pure python (GIL bound), a thread pool over the games wouldn't speed it up.
+        # a malformed game is logged and skipped rather than dropping the whole list.
+        recent_games = []
+        for game in game_data:
+            try:
+                recent_games.append(Game.from_api(game))
+
+            except (KeyError, TypeError, AttributeError):
+                self.logger.exception("Unable to create game object for game %s, skipping", game.get("id"))
+
+        # the cache keeps its own tuple, so changes to the returned list don't leak into later calls
+        with self._games_cache_lock:
+            self._games_cache[cache_key] = (time.monotonic(), tuple(recent_games))
+            self._games_cache.move_to_end(cache_key)
+            if len(self._games_cache) > _GAMES_CACHE_MAXSIZE:
+                self._games_cache.popitem(last=False)
+
+        return recent_games
+
+    def _get_cached_games(self, cache_key: tuple[str, int, str], summoner_id: str, region: str) -> list[Game] | None:
+        # a cached entry is dropped once it's older than the ttl or the summoner was renewed after it was built
+        with self._games_cache_lock:
+            entry = self._games_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            built_at, games = entry
+            last_renewal = self._renewed_at.get((region, summoner_id))
+            if time.monotonic() - built_at > _GAMES_CACHE_TTL or (
+                last_renewal is not None and last_renewal >= built_at
+            ):
+                del self._games_cache[cache_key]
+                return None
+
+            self._games_cache.move_to_end(cache_key)
+            return list(games)
+
+    def update(self, summoner_id: str | None = None, region: str | None = None) -> dict:
+        """
+        Send an update request to fetch the latest details for a summoner. (See `utils.update()`)
 
-                teams = []
-                for team in game.get("teams", []):
-                    game_stats = team.get("game_stat", {})
-                    teams.append(
-                        Team(
-                            key=team["key"],
-                            game_stat=GameStats(
-                                is_win=game_stats.get("is_win"),
-                                champion_kill=game_stats.get("champion_kill"),
-                                champion_first=game_stats.get("champion_first"),
-                                inhibitor_kill=game_stats.get("inhibitor_kill"),
-                                inhibitor_first=game_stats.get("inhibitor_first"),
-                                rift_herald_kill=game_stats.get("rift_herald_kill"),
-                                rift_herald_first=game_stats.get("rift_herald_first"),
-                                dragon_kill=game_stats.get("dragon_kill"),
-                                dragon_first=game_stats.get("dragon_first"),
-                                baron_kill=game_stats.get("baron_kill"),
-                                baron_first=game_stats.get("baron_first"),
-                                tower_kill=game_stats.get("tower_kill"),
-                                tower_first=game_stats.get("tower_first"),
-                                horde_kill=game_stats.get("horde_kill"),
-                                horde_first=game_stats.get("horde_first"),
-                                is_remake=game_stats.get("is_remake"),
-                                death=game_stats.get("death"),
-                                assist=game_stats.get("assist"),
-                                gold_earned=game_stats.get("gold_earned"),
-                                kill=game_stats.get("kill"),
-                            ),
-                            banned_champions=team.get("banned_champions"),
-                        )
-                    )
+        Any recent games this instance cached for the summoner are refetched on the next call.
 
-                my_data = game.get("myData", {})
-                tmp_game = Game(
-                    id=game.get("id"),
-                    created_at=game.get("created_at"),
-                    game_map=game.get("game_map"),
-                    queue_info=QueueInfo(
-                        id=game.get("queue_info", {}).get("id"),
-                        queue_translate=game.get("queue_info", {}).get("queue_translate"),
-                        game_type=game.get("queue_info", {}).get("game_type"),
-                    ),
-                    version=game.get("version"),
-                    game_length_second=game.get("game_length_second"),
-                    is_remake=game.get("is_remake"),
-                    is_opscore_active=game.get("is_opscore_active"),
-                    is_recorded=game.get("is_recorded"),
-                    record_info=game.get("record_info"),
-                    average_tier_info=Tier(
-                        tier=game.get("average_tier_info", {}).get("tier"),
-                        division=game.get("average_tier_info", {}).get("division"),
-                        tier_image_url=game.get("average_tier_info", {}).get("tier_image_url"),
-                        border_image_url=game.get("average_tier_info", {}).get("border_image_url"),
-                    ),
-                    participants=participants,
-                    teams=teams,
-                    memo=game.get("memo"),
-                    my_data=Participant(
-                        summoner=Summoner(
-                            id=my_data.get("summoner", {}).get("id"),
-                            summoner_id=my_data.get("summoner", {}).get("summoner_id"),
-                            acct_id=my_data.get("summoner", {}).get("acct_id"),
-                            puuid=my_data.get("summoner", {}).get("puuid"),
-                            game_name=my_data.get("summoner", {}).get("game_name"),
-                            tagline=my_data.get("summoner", {}).get("tagline"),
-                            name=my_data.get("summoner", {}).get("name"),
-                            internal_name=my_data.get("summoner", {}).get("internal_name"),
-                            profile_image_url=my_data.get("summoner", {}).get("profile_image_url"),
-                            level=my_data.get("summoner", {}).get("level"),
-                            updated_at=my_data.get("summoner", {}).get("updated_at"),
-                            renewable_at=my_data.get("summoner", {}).get("renewable_at"),
-                        ),
-                        participant_id=my_data.get("participant_id"),
-                        champion_id=my_data.get("champion_id"),
-                        team_key=my_data.get("team_key"),
-                        position=my_data.get("position"),
-                        role=my_data.get("role"),
-                        items=my_data.get("items"),
-                        trinket_item=my_data.get("trinket_item"),
-                        rune=None,
-                        # rune={
-                        #     game["myData"]["rune"]["primary_page_id"],
-                        #     game["myData"]["rune"]["primary_rune_id"],
-                        #     game["myData"]["rune"]["secondary_page_id"],
-                        # },  # temp, eventually turn this into an object..?
-                        spells=my_data.get("spells"),
-                        stats=Stats(
-                            champion_level=my_data.get("stats", {}).get("champion_level"),
-                            damage_self_mitigated=my_data.get("stats", {}).get("damage_self_mitigated"),
-                            damage_dealt_to_objectives=my_data.get("stats", {}).get("damage_dealt_to_objectives"),
-                            damage_dealt_to_turrets=my_data.get("stats", {}).get("damage_dealt_to_turrets"),
-                            magic_damage_dealt_player=my_data.get("stats", {}).get("magic_damage_dealt_player"),
-                            physical_damage_taken=my_data.get("stats", {}).get("physical_damage_taken"),
-                            physical_damage_dealt_to_champions=my_data.get("stats", {}).get(
-                                "physical_damage_dealt_to_champions"
-                            ),
-                            total_damage_taken=my_data.get("stats", {}).get("total_damage_taken"),
-                            total_damage_dealt=my_data.get("stats", {}).get("total_damage_dealt"),
-                            total_damage_dealt_to_champions=my_data.get("stats", {}).get(
-                                "total_damage_dealt_to_champions"
-                            ),
-                            largest_critical_strike=my_data.get("stats", {}).get("largest_critical_strike"),
-                            time_ccing_others=my_data.get("stats", {}).get("time_ccing_others"),
-                            vision_score=my_data.get("stats", {}).get("vision_score"),
-                            vision_wards_bought_in_game=my_data.get("stats", {}).get("vision_wards_bought_in_game"),
-                            sight_wards_bought_in_game=my_data.get("stats", {}).get("sight_wards_bought_in_game"),
-                            ward_kill=my_data.get("stats", {}).get("ward_kill"),
-                            ward_place=my_data.get("stats", {}).get("ward_place"),
-                            turret_kill=my_data.get("stats", {}).get("champion_level"),
-                            barrack_kill=my_data.get("stats", {}).get("barrack_kill"),
-                            kill=my_data.get("stats", {}).get("kill"),
-                            death=my_data.get("stats", {}).get("death"),
-                            assist=my_data.get("stats", {}).get("assist"),
-                            largest_multi_kill=my_data.get("stats", {}).get("largest_multi_kill"),
-                            largest_killing_spree=my_data.get("stats", {}).get("largest_killing_spree"),
-                            minion_kill=my_data.get("stats", {}).get("minion_kill"),
-                            neutral_minion_kill_team_jungle=my_data.get("stats", {}).get(
-                                "neutral_minion_kill_team_jungle"
-                            ),
-                            neutral_minion_kill_enemy_jungle=my_data.get("stats", {}).get(
-                                "neutral_minion_kill_enemy_jungle"
-                            ),
-                            neutral_minion_kill=my_data.get("stats", {}).get("neutral_minion_kill"),
-                            gold_earned=my_data.get("stats", {}).get("gold_earned"),
-                            total_heal=my_data.get("stats", {}).get("total_heal"),
-                            result=my_data.get("stats", {}).get("result"),
-                            op_score=my_data.get("stats", {}).get("op_score"),
-                            op_score_rank=my_data.get("stats", {}).get("op_score_rank"),
-                            is_opscore_max_in_team=my_data.get("stats", {}).get("is_opscore_max_in_team"),
-                            lane_score=my_data.get("stats", {}).get("lane_score"),
-                            op_score_timeline=my_data.get("stats", {}).get("op_score_timeline"),
-                            op_score_timeline_analysis=my_data.get("stats", {}).get("op_score_timeline_analysis"),
-                        ),
-                        tier_info=Tier(
-                            tier=my_data.get("tier_info", {}).get("tier"),
-                            division=my_data.get("tier_info", {}).get("division"),
-                            lp=my_data.get("tier_info", {}).get("lp"),
-                            level=my_data.get("tier_info", {}).get("level"),
-                            tier_image_url=my_data.get("tier_info", {}).get("tier_image_url"),
-                            border_image_url=my_data.get("tier_info", {}).get("border_image_url"),
-                        ),
-                    ),
-                )
+        ### Args:
+            summoner_id : `str, optional`
+                The summoner id to update. Defaults to the instance's `summoner_id`.
+
+            region : `str, optional`
+                The region to update in. Defaults to the instance's `region`.
+
+        ### Returns:
+            `dict` : The status response of the update.
+        """
+        from opgg.utils import update
+
+        summoner_id = summoner_id or self.summoner_id
+        region = region or self.region
+
+        res = update(summoner_id, region)
+
+        with self._games_cache_lock:
+            self._renewed_at[(region, summoner_id)] = time.monotonic()
+
+        return res
+
+    def update_many(self, summoner_ids: list[str], region: str | None = None) -> list[dict]:
+        """
+        Send update requests for several summoners at once. (See `utils.update_many()`)
+
+        Any recent games this instance cached for those summoners are refetched on the next call.
+
+        ### Args:
+            summoner_ids : `list[str]`
+                The summoner ids to update.
+
+            region : `str, optional`
+                The region to update in. Defaults to the instance's `region`.
+
+        ### Returns:
+            `list[dict]` : The status response of each update, in the same order as `summoner_ids`.
+        """
+        from opgg.utils import update_many
+
+        region = region or self.region
 
-                recent_games.append(tmp_game)
+        res = update_many(summoner_ids, region)
 
-            return recent_games
+        renewed_at = time.monotonic()
+        with self._games_cache_lock:
+            for summoner_id in summoner_ids:
+                self._renewed_at[(region, summoner_id)] = renewed_at
 
-        except:
-            self.logger.error(f"Unable to create game object, see trace: \n{traceback.format_exc()}")
-            pass
+        return res
@@ -5,9 +5,11 @@
 # License : BSD-3-Clause
 
 
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime
 from typing import Any
-from opgg.game import Stats, Team
+from opgg._common import _EMPTY
+from opgg.game import Stats, StatsTable, Team
 from opgg.params import By, Queue
 from opgg.season import Season
 from opgg.league_stats import LeagueStats, QueueInfo, Tier
@@ -18,6 +20,7 @@ LJF = 18
 RJF = 14
 
 
+@dataclass(slots=True)
 class Participant:
     """
     Represents a participant in the game with detailed information about their performance and loadout.\n
@@ -37,167 +40,47 @@ class Participant:
         `tier_info: Tier` - Tier information of the participant\n
     """
 
-    def __init__(
-        self,
-        summoner: "Summoner",
-        participant_id: int,
-        champion_id: int,
-        team_key: str,
-        position: str,
-        role: str,
-        items: list,
-        trinket_item: int,
-        rune: dict[str, int],  # temp. need to see if a Rune object is necessary
-        spells: list,
-        stats: Stats,
-        tier_info: Tier,
-    ):
-        self._summoner = summoner
-        self._participant_id = participant_id
-        self._champion_id = champion_id
-        self._team_key = team_key
-        self._position = position
-        self._role = role
-        self._items = items
-        self._trinket_item = trinket_item
-        self._rune = rune
-        self._spells = spells
-        self._stats = stats
-        self._tier_info = tier_info
-
-    @property
-    def summoner(self) -> "Summoner":
-        """
-        A `Summoner` object representing a summoner
-        """
-        return self._summoner
-
-    @summoner.setter
-    def summoner(self, value: "Summoner") -> None:
-        self._summoner = value
-
-    @property
-    def participant_id(self) -> int:
-        """
-        An `int` representing the participant id
-        """
-        return self._participant_id
-
-    @participant_id.setter
-    def participant_id(self, value: int) -> None:
-        self._participant_id = value
-
-    @property
-    def champion_id(self) -> int:
-        """
-        An `int` representing the champion id
-        """
-        return self._champion_id
-
-    @champion_id.setter
-    def champion_id(self, value: int) -> None:
-        self._champion_id = value
-
-    @property
-    def team_key(self) -> str:
-        """
-        A `str` representing the team (BLUE, RED)
-        """
-        return self._team_key
-
-    @team_key.setter
-    def team_key(self, value: str) -> None:
-        self._team_key = value
-
-    @property
-    def position(self) -> str:
-        """
-        A `str` representing the position the participant was playing
-        """
-        return self._position
-
-    @position.setter
-    def position(self, value: str) -> None:
-        self._position = value
-
-    @property
-    def role(self) -> str:
-        """
-        A `str` representing the role the participant was playing
-        """
-        return self._role
-
-    @role.setter
-    def role(self, value: str) -> None:
-        self._role = value
-
-    @property
-    def items(self) -> list[int]:
-        """
-        A `list[int]` representing the participants items
-        """
-        return self._items
-
-    @items.setter
-    def items(self, value: list[int]) -> None:
-        self._items = value
-
-    @property
-    def trinket_item(self) -> int:
-        """
-        An `int` representing the trinket item
-        """
-        return self._trinket_item
-
-    @trinket_item.setter
-    def trinket_item(self, value: int) -> None:
-        self._trinket_item = value
-
-    @property
-    def rune(self) -> dict[str, int]:
-        """
-        A `dict[str, int]` representing the rune configuration of the participant
-        """
-        return self._rune
-
-    @rune.setter
-    def rune(self, value: dict[str, int]) -> None:
-        self._rune = value
-
-    @property
-    def spells(self) -> list:
-        """
-        A `list` representing the spell configuration of the participant
-        """
-        return self._spells
-
-    @spells.setter
-    def spells(self, value: list) -> None:
-        self._spells = value
-
-    @property
-    def stats(self) -> Stats:
-        """
-        A `Stats` object representing the participants game stats
-        """
-        return self._stats
-
-    @stats.setter
-    def stats(self, value: Stats) -> None:
-        self._stats = value
-
-    @property
-    def tier_info(self) -> Tier:
-        """
-        A `Tier` object representing the participants league tier
-        """
-        return self._tier_info
+    summoner: "Summoner"
+    participant_id: int
+    champion_id: int
+    team_key: str
+    position: str
+    role: str
+    items: list
+    trinket_item: int
+    rune: dict[str, int]  # temp. need to see if a Rune object is necessary
+    spells: list
+    stats: Stats
+    tier_info: Tier
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Participant":
+        """
+        Build a `Participant` from a raw participant dict returned by OPGG. (An entry of a game's `participants`, or `myData`)
+        """
+        return cls(
+            summoner=Summoner.from_api(data.get("summoner") or _EMPTY),
+            participant_id=data.get("participant_id"),
+            champion_id=data.get("champion_id"),
+            team_key=data.get("team_key"),
+            position=data.get("position"),
+            role=data.get("role"),
+            items=data.get("items"),
+            trinket_item=data.get("trinket_item"),
+            rune=None,  # temp, eventually turn this into an object..?
+            spells=data.get("spells"),
+            stats=Stats.from_api(data.get("stats") or _EMPTY),
+            tier_info=Tier.from_api(data.get("tier_info")),
+        )
 
-    @tier_info.setter
-    def tier_info(self, value: Tier) -> None:
-        self._tier_info = value
+    def __repr__(self) -> str:
+        # kept short, the generated repr would dump the whole nested Summoner
+        return (
+            f"Participant(summoner={self.summoner.game_name}, champion_id={self.champion_id}, position={self.position})"
+        )
 
 
+@dataclass(slots=True)
 class Game:
     """
     Represents a game played by a summoner.\n
@@ -220,209 +103,57 @@ class Game:
         `myData: Participant` - User specific participant data
     """
 
-    def __init__(
-        self,
-        id: str,
-        created_at: datetime,
-        game_map: str,
-        queue_info: QueueInfo,
-        version: str,
-        game_length_second: int,
-        is_remake: bool,
-        is_opscore_active: bool,
-        is_recorded: bool,
-        record_info: Any,
-        average_tier_info: Tier,
-        participants: list[Participant],
-        teams: list[Team],
-        memo: Any,
-        my_data: Participant,
-    ):
-        self._id = id
-        self._created_at = created_at
-        self._game_map = game_map
-        self._queue_info = queue_info
-        self._version = version
-        self._game_length_second = game_length_second
-        self._is_remake = is_remake
-        self._is_opscore_active = is_opscore_active
-        self._is_recorded = is_recorded
-        self._record_info = record_info
-        self._average_tier_info = average_tier_info
-        self._participants = participants
-        self._teams = teams
-        self._memo = memo
-        self._my_data = my_data
-
-    @property
-    def id(self) -> str:
-        """
-        A `str` representing the Internal game id
-        """
-        return self._id
-
-    @id.setter
-    def id(self, value: str) -> None:
-        self._id = value
-
-    @property
-    def created_at(self) -> datetime:
-        """
-        A `datetime` object representing the Date & Time of game played
-        """
-        return self._created_at
-
-    @created_at.setter
-    def created_at(self, value: datetime) -> None:
-        self._created_at = value
-
-    @property
-    def game_map(self) -> str:
-        """
-        A `str` representing the game map (Summoners Rift, Howling Abyss, etc.)
-        """
-        return self._game_map
-
-    @game_map.setter
-    def game_map(self, value: str) -> None:
-        self._game_map = value
-
-    @property
-    def queue_info(self) -> QueueInfo:
-        """
-        A `QueueInfo` object representing queue information
-        """
-        return self._queue_info
-
-    @queue_info.setter
-    def queue_info(self, value: QueueInfo) -> None:
-        self._queue_info = value
-
-    @property
-    def version(self) -> str:
-        """
-        A `str` representing the game version
-        """
-        return self._version
-
-    @version.setter
-    def version(self, value: str) -> None:
-        self._version = value
-
-    @property
-    def game_length_second(self) -> int:
-        """
-        An `int` representing the length of the game in seconds
-        """
-        return self._game_length_second
-
-    @game_length_second.setter
-    def game_length_second(self, value: int) -> None:
-        self._game_length_second = value
-
-    @property
-    def is_remake(self) -> bool:
-        """
-        A `bool` representing whether the game was a remake
-        """
-        return self._is_remake
-
-    @is_remake.setter
-    def is_remake(self, value: bool) -> None:
-        self._is_remake = value
-
-    @property
-    def is_opscore_active(self) -> bool:
-        """
-        A `bool` representing whether the opscore was active
-        """
-        return self._is_opscore_active
-
-    @is_opscore_active.setter
-    def is_opscore_active(self, value: bool) -> None:
-        self._is_opscore_active = value
-
-    @property
-    def is_recorded(self) -> bool:
-        """
-        A `bool` representing whether the game was recorded
-        """
-        return self._is_recorded
-
-    @is_recorded.setter
-    def is_recorded(self, value: bool) -> None:
-        self._is_recorded = value
-
-    @property
-    def record_info(self) -> Any:
-        """
-        An `Any` object with unknown return value and type
-        """
-        return self._record_info
-
-    @record_info.setter
-    def record_info(self, value: Any) -> None:
-        self._record_info = value
-
-    @property
-    def average_tier_info(self) -> Tier:
-        """
-        A `Tier` object representing the average league tier
-        """
-        return self._average_tier_info
-
-    @average_tier_info.setter
-    def average_tier_info(self, value: Tier) -> None:
-        self._average_tier_info = value
-
-    @property
-    def participants(self) -> list[Participant]:
-        """
-        A `list[Participant]` object(s) representing all participants of a game
-        """
-        return self._participants
-
-    @participants.setter
-    def participants(self, value: list[Participant]) -> None:
-        self._participants = value
-
-    @property
-    def teams(self) -> list[Team]:
-        """
-        A `list[Team]` object(s) representing all teams of a game
-        """
-        return self._teams
-
-    @teams.setter
-    def teams(self, value: list[Team]) -> None:
-        self._teams = value
-
-    @property
-    def memo(self) -> Any:
-        """
-        An `Any` object with unknown return value and type
-        """
-        return self._memo
-
-    @memo.setter
-    def memo(self, value: Any) -> None:
-        self._memo = value
+    id: str
+    created_at: datetime
+    game_map: str
+    queue_info: QueueInfo
+    version: str
+    game_length_second: int
+    is_remake: bool
+    is_opscore_active: bool
+    is_recorded: bool
+    record_info: Any
+    average_tier_info: Tier
+    participants: list[Participant]
+    teams: list[Team]
+    memo: Any
+    my_data: Participant
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Game":
+        """
+        Build a `Game` (with its participants and teams) from a raw game dict returned by the /games endpoint.
+        """
+        return cls(
+            id=data.get("id"),
+            created_at=data.get("created_at"),
+            game_map=data.get("game_map"),
+            queue_info=QueueInfo.from_api(data.get("queue_info")),
+            version=data.get("version"),
+            game_length_second=data.get("game_length_second"),
+            is_remake=data.get("is_remake"),
+            is_opscore_active=data.get("is_opscore_active"),
+            is_recorded=data.get("is_recorded"),
+            record_info=data.get("record_info"),
+            average_tier_info=Tier.from_api(data.get("average_tier_info")),
+            participants=[Participant.from_api(participant) for participant in data.get("participants") or ()],
+            teams=[Team.from_api(team) for team in data.get("teams") or ()],
+            memo=data.get("memo"),
+            my_data=Participant.from_api(data.get("myData") or _EMPTY),
+        )
 
-    @property
-    def my_data(self) -> Participant:
+    def build_stats_table(self) -> StatsTable:
         """
-        A `Participant` object representing personal participant record
+        Build a column-oriented `StatsTable` of the participants' stats, row `i` is `participants[i]`.\n
+        Every call builds a new table, keep the result around if you aggregate over it more than once.
         """
-        return self._my_data
-
-    @my_data.setter
-    def my_data(self, value: Participant) -> None:
-        self._my_data = value
+        return StatsTable.from_stats(participant.stats for participant in self.participants)
 
     def __repr__(self) -> str:
         return f"Game(champion_id={self.my_data.champion_id}, kill={self.my_data.stats.kill}, death={self.my_data.stats.death}, assist={self.my_data.stats.assist}, position={self.my_data.position}, result={self.my_data.stats.result})"
 
 
+@dataclass(slots=True)
 class Summoner:
     """
     Represents a summoner.\n
@@ -446,217 +177,39 @@ class Summoner:
         `recent_game_stats: Game | list[Game]` - Recent game stats\n
     """
 
-    def __init__(
-        self,
-        id: int,
-        summoner_id: str,
-        acct_id: str,
-        puuid: str,
-        game_name: str,
-        tagline: str,
-        name: str,
-        internal_name: str,
-        profile_image_url: str,
-        level: int,
-        updated_at: datetime,
-        renewable_at: datetime,
-        previous_seasons: Season | list[Season] = None,
-        league_stats: LeagueStats | list[LeagueStats] = None,
-        most_champions: list[ChampionStats] = None,
-        recent_game_stats: Game | list[Game] = None,
-    ):
-        self._id = id
-        self._summoner_id = summoner_id
-        self._acct_id = acct_id
-        self._puuid = puuid
-        self._game_name = game_name
-        self._tagline = tagline
-        self._name = name
-        self._internal_name = internal_name
-        self._profile_image_url = profile_image_url
-        self._level = level
-        self._updated_at = updated_at
-        self._renewable_at = renewable_at
-        self._previous_seasons = previous_seasons
-        self._league_stats = league_stats
-        self._most_champions = most_champions
-        self._recent_game_stats = recent_game_stats
-
-    @property
-    def id(self) -> int:
-        """
-        An `int` representing the id (opgg specific)
-        """
-        return self._id
-
-    @id.setter
-    def id(self, value: int) -> None:
-        self._id = value
-
-    @property
-    def summoner_id(self) -> str:
-        """
-        A `str` representing the summoner id (riot api)
-        """
-        return self._summoner_id
-
-    @summoner_id.setter
-    def summoner_id(self, value: str) -> None:
-        self._summoner_id = value
-
-    @property
-    def acct_id(self) -> str:
-        """
-        A `str` representing the account id (riot api)
-        """
-        return self._acct_id
-
-    @acct_id.setter
-    def acct_id(self, value: str) -> None:
-        self._acct_id = value
-
-    @property
-    def puuid(self) -> str:
-        """
-        A `str` representing the puuid (riot api)
-        """
-        return self._puuid
-
-    @puuid.setter
-    def puuid(self, value: str) -> None:
-        self._puuid = value
-
-    @property
-    def game_name(self) -> str:
-        """
-        A `str` representing the in-game username
-        """
-        return self._game_name
-
-    @game_name.setter
-    def game_name(self, value: str) -> None:
-        self._game_name = value
-
-    @property
-    def tagline(self) -> str:
-        """
-        A `str` representing the tagline
-        """
-        return self._tagline
-
-    @tagline.setter
-    def tagline(self, value: str) -> None:
-        self._tagline = value
-
-    @property
-    def name(self) -> str:
-        """
-        A `str` representing the summoner name
-        """
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        self._name = value
-
-    @property
-    def internal_name(self) -> str:
-        """
-        A `str` representing the internal name
-        """
-        return self._internal_name
-
-    @internal_name.setter
-    def internal_name(self, value: str) -> None:
-        self._internal_name = value
-
-    @property
-    def profile_image_url(self) -> str:
-        """
-        A `str` representing the profile image url
-        """
-        return self._profile_image_url
-
-    @profile_image_url.setter
-    def profile_image_url(self, value: str) -> None:
-        self._profile_image_url = value
-
-    @property
-    def level(self) -> int:
-        """
-        An `int` representing the summoner level
-        """
-        return self._level
-
-    @level.setter
-    def level(self, value: int) -> None:
-        self._level = value
+    id: int
+    summoner_id: str
+    acct_id: str
+    puuid: str
+    game_name: str
+    tagline: str
+    name: str
+    internal_name: str
+    profile_image_url: str
+    level: int
+    updated_at: datetime
+    renewable_at: datetime
+    previous_seasons: Season | list[Season] = None
+    league_stats: LeagueStats | list[LeagueStats] = None
+    most_champions: list[ChampionStats] = None
+    recent_game_stats: Game | list[Game] = None
+
+    @classmethod
+    def from_api(cls, data: dict, **kwargs) -> "Summoner":
+        """
+        Build a `Summoner` from a raw summoner dict returned by OPGG.
 
-    @property
-    def updated_at(self) -> datetime:
-        """
-        A `datetime` object representing when the summoner was last updated
-        """
-        return self._updated_at
-
-    @updated_at.setter
-    def updated_at(self, value: datetime) -> None:
-        self._updated_at = value
-
-    @property
-    def renewable_at(self) -> datetime:
-        """
-        A `datetime` object representing when the summoner can be renewed
-        """
-        return self._renewable_at
-
-    @renewable_at.setter
-    def renewable_at(self, value: datetime) -> None:
-        self._renewable_at = value
-
-    @property
-    def previous_seasons(self) -> Season | list[Season]:
-        """
-        A `Season | list[Season]` object(s) representing the previously played seasons
-        """
-        return self._previous_seasons
-
-    @previous_seasons.setter
-    def previous_seasons(self, value: Season | list[Season]) -> None:
-        self._previous_seasons = value
-
-    @property
-    def league_stats(self) -> LeagueStats | list[LeagueStats]:
-        """
-        A `LeagueStats | list[LeagueStats]` object(s) representing all applicable league stats
-        """
-        return self._league_stats
-
-    @league_stats.setter
-    def league_stats(self, value: LeagueStats | list[LeagueStats]) -> None:
-        self._league_stats = value
-
-    @property
-    def most_champions(self) -> list[ChampionStats]:
-        """
-        A `list[ChampionStats]` objects representing the most played champions
-        """
-        return self._most_champions
+        ### Args:
+            data : `dict`
+                The raw summoner dict.
 
-    @most_champions.setter
-    def most_champions(self, value: list[ChampionStats]) -> None:
-        self._most_champions = value
+            **kwargs :
+                Any of `previous_seasons`, `league_stats`, `most_champions` or `recent_game_stats`, which are built separately.
 
-    @property
-    def recent_game_stats(self) -> Game | list[Game]:
-        """
-        A `Game | list[Game]` object(s) representing the most recent games
+        ### Returns:
+            `Summoner` : The summoner object.
         """
-        return self._recent_game_stats
-
-    @recent_game_stats.setter
-    def recent_game_stats(self, value: Game | list[Game]) -> None:
-        self._recent_game_stats = value
+        return cls(*map(data.get, _SUMMONER_API_FIELDS), **kwargs)
 
     def get_tier_from_queue(self, queue: Queue = Queue.SOLO) -> Tier:
         """
@@ -683,13 +236,19 @@ class Summoner:
     def __repr__(self) -> str:
         previous_seasons_fmt, league_stats_fmt, champion_stats_fmt, game_fmt = "", "", "", ""
 
-        for season in self.previous_seasons:
+        # participants' summoners are built without these, so they can be None
+        previous_seasons = self.previous_seasons or ()
+        league_stats = self.league_stats or ()
+        most_champions = self.most_champions or ()
+        recent_game_stats = self.recent_game_stats or ()
+
+        for season in previous_seasons:
             previous_seasons_fmt += f"{''.ljust(LJF + RJF)}  | {season}\n"
-        for league_stat in self.league_stats:
+        for league_stat in league_stats:
             league_stats_fmt += f"{''.ljust(LJF + RJF)}  | {league_stat}\n"
-        for champ_stat in self.most_champions:
+        for champ_stat in most_champions:
             champion_stats_fmt += f"{''.ljust(LJF + RJF)}  | {champ_stat}\n"
-        for game in self.recent_game_stats:
+        for game in recent_game_stats:
             game_fmt += f"{''.ljust(LJF + RJF)}  | {game}\n"
 
         return (
@@ -706,8 +265,13 @@ class Summoner:
             f"{'Level'.ljust(LJF)} {'(int)'.rjust(RJF)} | {self.level}\n"
             f"{'Updated At'.ljust(LJF)} {'(datetime)'.rjust(RJF)} | {self.updated_at}\n"
             f"{'Renewable At'.ljust(LJF)} {'(datetime)'.rjust(RJF)} | {self.renewable_at}\n"
-            f"{'Previous Seasons'.ljust(LJF)} {'(Season)'.rjust(RJF)} | [List ({len(self.previous_seasons)})] \n{previous_seasons_fmt}"
-            f"{'League Stats'.ljust(LJF)} {'(LeagueStats)'.rjust(RJF)} | [List ({len(self.league_stats)})] \n{league_stats_fmt}"
-            f"{'Most Champions'.ljust(LJF)} {'(ChampStats)'.rjust(RJF)} | [List ({len(self.most_champions)})] \n{champion_stats_fmt}"
-            f"{'Recent Game Stats'.ljust(LJF)} {'(Game)'.rjust(RJF)} | [List ({len(self.recent_game_stats)})] \n{game_fmt}"
+            f"{'Previous Seasons'.ljust(LJF)} {'(Season)'.rjust(RJF)} | [List ({len(previous_seasons)})] \n{previous_seasons_fmt}"
+            f"{'League Stats'.ljust(LJF)} {'(LeagueStats)'.rjust(RJF)} | [List ({len(league_stats)})] \n{league_stats_fmt}"
+            f"{'Most Champions'.ljust(LJF)} {'(ChampStats)'.rjust(RJF)} | [List ({len(most_champions)})] \n{champion_stats_fmt}"
+            f"{'Recent Game Stats'.ljust(LJF)} {'(Game)'.rjust(RJF)} | [List ({len(recent_game_stats)})] \n{game_fmt}"
         )
+
+
+# Summoner fields that come straight from the api dict, in declaration order.
+# these are the ones without a default, the rest are built separately and passed to from_api() as kwargs
+_SUMMONER_API_FIELDS = tuple(f.name for f in fields(Summoner) if f.default is MISSING)
@@ -4,16 +4,17 @@
 # Date    : 2024-07-10
 # License : BSD-3-Clause
 
-from datetime import datetime
-import json
-from json import JSONDecodeError
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from typing import NamedTuple
 
 import requests
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
 
+from opgg._common import _loads
 from opgg.cacher import Cacher
-from opgg.champion import Champion, Passive, Price, Skin, Spell
+from opgg.champion import Champion
 from opgg.params import By, Region
 from opgg.season import SeasonInfo
 
@@ -28,8 +29,23 @@ License: BSD-3-Clause, See LICENSE for more details.
 BASE_API_URL = "https://lol-web-api.op.gg/api/v1.0/internal/bypass"
 API_URL = f"{BASE_API_URL}/summoners/{{region}}/{{summoner_id}}/renewal"
 
-ua = UserAgent()
-HEADERS = {"User-Agent": ua.random}
+# a fixed UA for the module level helpers, building a fake_useragent db on import cost every `import opgg.utils`
+# a noticeable delay. OPGG objects still pick a random one when they're constructed.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+)
+HEADERS = {"User-Agent": USER_AGENT}
+
+# shared session so repeated update/page props/champion calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# the page props live in a single json <script> tag, no need to build the whole DOM to get at it
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# one cacher for the module, the db reads themselves are memoized by the _memoize_for_process loaders below
+_CACHER = Cacher()
 
 
 def update(summoner_id: str, region: Region = Region.NA) -> dict:
@@ -58,11 +74,37 @@ def update(summoner_id: str, region: Region = Region.NA) -> dict:
         ```
     """
 
-    res = requests.post(API_URL.format(region=region, summoner_id=summoner_id), headers=HEADERS)
+    res = _SESSION.post(API_URL.format(region=region, summoner_id=summoner_id))
     if not res.ok:
         res.raise_for_status()
 
-    return res.json()
+    return _loads(res.content)
+
+
+def update_many(summoner_ids: list[str], region: Region = Region.NA) -> list[dict]:
+    """
+    Send update requests for several summoners (ids) at once.
+
+    The requests are sent concurrently over the shared session, so the total wait is roughly one
+    round trip rather than one per summoner.
+
+    ### Parameters
+        summoner_ids : `list[str]`
+            Pass a list of summoner ids to be updated
+
+        region : `Region, optional`
+            Pass the region you want to perform the updates in. Default is "NA".
+
+    ### Returns
+        `list[dict]` : Returns the status response of each update, in the same order as `summoner_ids`. (See `update`)
+    """
+
+    if len(summoner_ids) < 2:
+        return [update(summoner_id, region) for summoner_id in summoner_ids]
+
+    # the session's pool holds 10 connections, more workers than that would just wait on it
+    with ThreadPoolExecutor(max_workers=min(10, len(summoner_ids))) as executor:
+        return list(executor.map(partial(update, region=region), summoner_ids))
 
 
 def get_page_props(summoner_names: str | list[str] = "ColbyFaulkn1", region=Region.NA) -> dict:
@@ -86,16 +128,47 @@ def get_page_props(summoner_names: str | list[str] = "ColbyFaulkn1", region=Regi
 
     url = f"https://www.op.gg/multisearch/{region}?summoners={summoner_names}"
 
-    res = requests.get(url, headers=HEADERS, allow_redirects=True)
-    soup = BeautifulSoup(res.content, "html.parser")
+    res = _SESSION.get(url, allow_redirects=True)
 
     try:
-        return json.loads(soup.select_one("#__NEXT_DATA__").text)["props"]["pageProps"]
+        match = _NEXT_DATA_RE.search(res.content)
+        if match:
+            return _loads(match.group(1))["props"]["pageProps"]
+
+        # markup changed (attribute order etc.), fall back to a proper html parse
+        from bs4 import BeautifulSoup, SoupStrainer
 
-    except JSONDecodeError:
+        # only the one script tag is kept, the rest of the page never makes it into the tree
+        soup = BeautifulSoup(
+            res.content, "html.parser", parse_only=SoupStrainer("script", attrs={"id": "__NEXT_DATA__"})
+        )
+        return _loads(soup.select_one("#__NEXT_DATA__").text)["props"]["pageProps"]
+
+    except ValueError:
         return {}
 
 
+def _memoize_for_process(fetch):
+    """
+    Memoize a no-argument loader for the life of the process. (Its result only depends on the cache db / OPGG.)
+
+    A falsy result is a failed fetch and isn't kept, so the next call tries again.
+    The memo can be dropped with `cache_clear()`, e.g. after the cache db has been refreshed.
+    """
+    cached = lru_cache(maxsize=1)(fetch)
+
+    @wraps(fetch)
+    def wrapper():
+        result = cached()
+        if not result:
+            cached.cache_clear()
+
+        return result
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 def get_all_seasons(page_props=None) -> list[SeasonInfo]:
     """
     Get all seasons from OPGG.
@@ -109,36 +182,48 @@ def get_all_seasons(page_props=None) -> list[SeasonInfo]:
             Note: Defaults to None, but if you pass them it reduces the overhead of another request out to OPGG.
 
     ### Returns:
-        `list[SeasonInfo]` : A list of SeasonInfo objects.
+        `list[SeasonInfo]` : A list of SeasonInfo objects.\n
+        Note: Without `page_props` the result is memoized for the process, call `get_all_seasons.cache_clear()` to refetch.
     """
+    if page_props is None:
+        return list(_load_seasons())
+
+    return _get_all_seasons(page_props)
+
+
+def _get_all_seasons(page_props=None) -> list[SeasonInfo]:
     # Check cache, if found, return it, otherwise continue to below logic.
-    cached_seasons = Cacher().get_all_seasons()
+    cached_seasons = _CACHER.get_all_seasons()
     if cached_seasons:
         return cached_seasons
 
-    seasons = []
-
     # For seasons specifically, if page_props is not passed, we MUST use it.
     # I have not been able to find a seasons endpoint on the api yet.
     if page_props is None:
         page_props = get_page_props()
 
-    for season in dict(page_props["seasonsById"]).values():
-        if season:
-            seasons.append(
-                SeasonInfo(
-                    id=season.get("id"),
-                    value=season.get("value"),
-                    display_value=season.get("display_value"),
-                    split=season.get("split"),
-                    is_preseason=season.get("is_preseason"),
-                )
-            )
+    return [
+        SeasonInfo(
+            id=season.get("id"),
+            value=season.get("value"),
+            display_value=season.get("display_value"),
+            split=season.get("split"),
+            is_preseason=season.get("is_preseason"),
+        )
+        for season in page_props["seasonsById"].values()
+        if season
+    ]
+
+
+@_memoize_for_process
+def _load_seasons() -> tuple[SeasonInfo, ...]:
+    return tuple(_get_all_seasons())
 
-    return seasons
 
+get_all_seasons.cache_clear = _load_seasons.cache_clear
 
-def get_season_by(by: By, value: int | str | list) -> SeasonInfo | list[SeasonInfo]:
+
+def get_season_by(by: By, value: int | str | list) -> SeasonInfo | list[SeasonInfo] | None:
     """
     Get a season by a specific metric.
 
@@ -150,17 +235,15 @@ def get_season_by(by: By, value: int | str | list) -> SeasonInfo | list[SeasonIn
             Pass the value(s) you want to search by. (id, display_value, etc.)
 
     ### Returns:
-        `SeasonInfo | list[SeasonInfo]` : A single or list of SeasonInfo objects.
+        `SeasonInfo | list[SeasonInfo] | None` : A single or list of SeasonInfo objects, or None if nothing matched.
     """
     all_seasons = get_all_seasons()
     result_set = []
 
     if by == By.ID:
         if isinstance(value, list):
-            for season in all_seasons:
-                for _id in value:
-                    if season.id == _id:
-                        result_set.append(season)
+            wanted = set(value)
+            result_set = [season for season in all_seasons if season.id in wanted]
 
         else:
             for season in all_seasons:
@@ -169,6 +252,9 @@ def get_season_by(by: By, value: int | str | list) -> SeasonInfo | list[SeasonIn
 
     # TODO: perhaps add more ways to get season objs, like by is_preseason, or display_name, etc.
 
+    if not result_set:
+        return None
+
     return result_set if len(result_set) > 1 else result_set[0]
 
 
@@ -185,95 +271,106 @@ def get_all_champions(page_props=None) -> list[Champion]:
             Note: Defaults to None, but if you pass them it reduces the overhead of another request out to OPGG.
 
     Returns:
-        `list[Champion]` : A list of Champion objects.
+        `list[Champion]` : A list of Champion objects.\n
+        Note: Without `page_props` the result is memoized for the process, call `get_all_champions.cache_clear()` to refetch.
     """
+    if not page_props:
+        return list(_load_champion_index().champions)
+
+    return [Champion.from_api(champion) for champion in page_props["championsById"].values()]
+
+
+class _ChampionIndex(NamedTuple):
+    # the champion list plus id, key and name lookup tables for the single value get_champion_by paths
+    champions: tuple[Champion, ...]
+    by_id: dict[int, Champion]
+    by_key: dict[str, Champion]
+    by_name: dict[str, Champion]
+
+    def __bool__(self) -> bool:
+        # an index without champions is a failed fetch
+        return bool(self.champions)
+
+
+def _index_champions(champions) -> _ChampionIndex:
+    champions = tuple(champions)
+    return _ChampionIndex(
+        champions,
+        {champ.id: champ for champ in champions},
+        {champ.key: champ for champ in champions},
+        {champ.name: champ for champ in champions},
+    )
+
+
+@_memoize_for_process
+def _load_champion_index() -> _ChampionIndex:
+    return _index_champions(_fetch_all_champions())
+
+
+def _fetch_all_champions() -> tuple[Champion, ...]:
     # Check cache, if found, return it, otherwise continue to below logic.
-    champions = []
+    cached_champions = _CACHER.get_all_champs()
+    if cached_champions:
+        return tuple(cached_champions)
 
-    if not page_props:
-        cached_champions = Cacher().get_all_champs()
-        if cached_champions:
-            return cached_champions
+    res = _SESSION.get(f"{BASE_API_URL}/meta/champions?hl=en_US")
+    try:
+        raw_champs_data = _loads(res.content)["data"]
 
-        res = requests.get(f"{BASE_API_URL}/meta/champions?hl=en_US", headers=HEADERS)
-        try:
-            raw_champs_data = json.loads(res.text)["data"]
+    except ValueError:
+        raw_champs_data = []
 
-        except JSONDecodeError:
-            raw_champs_data = []
+    return tuple(Champion.from_api(champion) for champion in raw_champs_data)
 
-    else:
-        raw_champs_data = dict(page_props["championsById"]).values()
-
-    for champion in raw_champs_data:
-        # reset per iteration
-        spells = []
-        skins = []
-
-        for skin in champion.get("skins", []):
-            prices = []
-
-            for price in skin.get("prices", []):
-                prices.append(
-                    Price(
-                        currency=price.get("currency") if "RP" in price.get("currency", "") else "BE",
-                        cost=price.get("cost"),
-                    )
-                )
-
-            skins.append(
-                Skin(
-                    id=skin.get("id"),
-                    champion_id=skin.get("champion_id"),
-                    name=skin.get("name"),
-                    centered_image=skin.get("centered_image"),
-                    skin_video_url=skin.get("skin_video_url"),
-                    prices=prices,
-                    release_date=datetime.fromisoformat(skin["release_date"]) if skin.get("release_date") else None,
-                    sales=skin.get("sales"),
-                )
-            )
-
-        for spell in champion.get("spells", []):
-            spells.append(
-                Spell(
-                    key=spell.get("key"),
-                    name=spell.get("name"),
-                    description=spell.get("description"),
-                    max_rank=spell.get("max_rank"),
-                    range_burn=spell.get("range_burn"),
-                    cooldown_burn=spell.get("cooldown_burn"),
-                    cooldown_burn_float=spell.get("cooldown_burn_float"),
-                    cost_burn=spell.get("cost_burn"),
-                    tooltip=spell.get("tooltip"),
-                    image_url=spell.get("image_url"),
-                    video_url=spell.get("video_url"),
-                )
-            )
-
-        champions.append(
-            Champion(
-                id=champion.get("id"),
-                key=champion.get("key"),
-                name=champion.get("name"),
-                image_url=champion.get("image_url"),
-                evolve=champion.get("evolve"),
-                partype=champion.get("partype"),
-                passive=Passive(
-                    name=champion.get("passive", {}).get("name"),
-                    description=champion.get("passive", {}).get("description"),
-                    image_url=champion.get("passive", {}).get("image_url"),
-                    video_url=champion.get("passive", {}).get("video_url"),
-                ),
-                spells=spells,
-                skins=skins,
-            )
-        )
 
-    return champions
+get_all_champions.cache_clear = _load_champion_index.cache_clear
+
+
+# list values are matched with a set, one pass over the champions instead of champions x values.
+# single values are a straight dict lookup.
+def _by_id(index: _ChampionIndex, value, **_) -> list[Champion]:
+    if isinstance(value, list):
+        wanted = set(value)
+        return [champ for champ in index.champions if champ.id in wanted]
+
+    champ = index.by_id.get(int(value))
+    return [champ] if champ is not None else []
+
+
+def _by_key(index: _ChampionIndex, value, **_) -> list[Champion]:
+    if isinstance(value, list):
+        wanted = set(value)
+        return [champ for champ in index.champions if champ.key in wanted]
+
+    champ = index.by_key.get(value)
+    return [champ] if champ is not None else []
+
 
+def _by_name(index: _ChampionIndex, value, **_) -> list[Champion]:
+    if isinstance(value, list):
+        wanted = set(value)
+        return [champ for champ in index.champions if champ.name in wanted]
 
-def get_champion_by(by: By, value: int | str | list, **kwargs) -> Champion | list[Champion]:
+    champ = index.by_name.get(value)
+    return [champ] if champ is not None else []
+
+
+def _by_cost(index: _ChampionIndex, value, currency="", **_) -> list[Champion]:
+    # the champion's own cost table is read instead of building Price objects for every base skin
+    currency = str(currency)
+    costs = set(value) if isinstance(value, (list, set, tuple)) else {int(value)}
+    return [champ for champ in index.champions if champ.get_cost_by(currency) in costs]
+
+
+_CHAMPION_LOOKUPS = {
+    By.ID: _by_id,
+    By.KEY: _by_key,
+    By.NAME: _by_name,
+    By.COST: _by_cost,
+}
+
+
+def get_champion_by(by: By, value: int | str | list, **kwargs) -> Champion | list[Champion] | None:
     """
     Get a single or list of champions by a specific metric.
 
@@ -290,58 +387,25 @@ def get_champion_by(by: By, value: int | str | list, **kwargs) -> Champion | lis
 
             Example:
                 `get_champion_by(By.COST, 450, currency=By.BLUE_ESSENCE)`
+
+    ### Returns:
+        `Champion | list[Champion] | None` : A single Champion, a list if more than one matched, or None if nothing did.
     """
     # Currently kwargs only handles "currency" for the cost of a champion,
     # but I might introduce other metrics of getting champ objs later, idk...
 
-    if kwargs.get("page_props"):
-        all_champs = get_all_champions(page_props=kwargs["page_props"])
+    page_props = kwargs.pop("page_props", None)
+    if page_props:
+        index = _index_champions(get_all_champions(page_props=page_props))
 
     else:
-        all_champs = get_all_champions()
+        index = _load_champion_index()
 
-    result_set = []
-    if by == By.ID:
-        if isinstance(value, list):
-            for champ in all_champs:
-                for _id in value:
-                    if champ.id == _id:
-                        result_set.append(champ)
-
-        else:
-            for champ in all_champs:
-                if champ.id == int(value):
-                    result_set.append(champ)
+    lookup = _CHAMPION_LOOKUPS.get(by)
+    result_set = lookup(index, value, **kwargs) if lookup else []
 
-    elif by == By.KEY:
-        if isinstance(value, list):
-            for champ in all_champs:
-                for key in value:
-                    if champ.key == key:
-                        result_set.append(champ)
-        else:
-            for champ in all_champs:
-                if champ.key == value:
-                    result_set.append(champ)
-
-    elif by == By.NAME:
-        if isinstance(value, list):
-            for champ in all_champs:
-                for name in value:
-                    if champ.name == name:
-                        result_set.append(champ)
-
-        else:
-            for champ in all_champs:
-                if champ.name == value:
-                    result_set.append(champ)
-
-    elif by == By.COST:
-        for champ in all_champs:
-            if champ.skins[0].prices:
-                for price in champ.skins[0].prices:
-                    if str(kwargs.get("currency", "")).upper() == price.currency and price.cost in value:
-                        result_set.append(champ)
+    if not result_set:
+        return None
 
     # if the result set is larger than one, return the whole list, otherwise just return the object itself.
     return result_set if len(result_set) > 1 else result_set[0]
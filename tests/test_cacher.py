@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from opgg.cacher import Cacher
+
+
+class CacherSkinTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cacher = Cacher(db_path=os.path.join(self.tmp_dir.name, "opgg-test.db"))
+
+        conn = self.cacher.connect()
+        conn.execute(
+            """
+            CREATE TABLE tblSkins (
+                champion_id, skin_id PRIMARY KEY, skin_name, skin_centered_image, skin_video_url,
+                skin_prices, skin_sales, skin_release_date
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO tblSkins VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (1, 1000, "Default", None, None, "BE: 450,RP: 260", None, None),
+                (1, 1001, "Broken", None, None, "BE: None,RP: 975", None, None),
+                (1, 1002, "All broken", None, None, "BE: None", None, None),
+                (1, 1003, "Free", None, None, None, None, None),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_skins_skips_malformed_costs(self):
+        skins = {skin.id: skin for skin in self.cacher.get_skins(1)}
+
+        self.assertEqual(skins[1000].prices, (("BE", 450), ("RP", 260)))
+        self.assertEqual(skins[1001].prices, (("RP", 975),))
+        self.assertIsNone(skins[1002].prices)
+        self.assertIsNone(skins[1003].prices)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import os
+import sys
+import unittest
+from dataclasses import FrozenInstanceError, fields, replace
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from opgg.champion import Champion, ChampionStats, ChampionStatsTable, Passive, Skin, Spell
+from opgg.params import By
+
+CHAMPION_STATS_FIELDS = [f.name for f in fields(ChampionStats) if f.init and f.name != "champion"]
+
+RAW_CHAMPION = {
+    "id": 22,
+    "key": "Ashe",
+    "name": "Ashe",
+    "image_url": "https://opgg-static.akamaized.net/meta/images/lol/champion/Ashe.png",
+    "evolve": [],
+    "partype": "Mana",
+    "passive": {"name": "Frost Shot", "description": "...", "image_url": None, "video_url": None},
+    "spells": [{"key": "Q", "name": "Ranger's Focus", "max_rank": 5, "range_burn": [600] * 5}],
+    "skins": [
+        {"id": 22000, "champion_id": 22, "name": "Default", "prices": [{"currency": "IP", "cost": 450}]},
+        {"id": 22001, "champion_id": 22, "name": "Freljord Ashe", "prices": [{"currency": "RP", "cost": 520}]},
+    ],
+}
+
+
+def make_stats(champion, **values) -> ChampionStats:
+    return ChampionStats(champion, **{name: values.get(name, 0) for name in CHAMPION_STATS_FIELDS})
+
+
+class ChampionStatsTableTests(unittest.TestCase):
+    def setUp(self):
+        self.stats = [
+            make_stats("Ashe", id=22, play=10, kill=30, death=10, assist=50, penta_kill=1),
+            make_stats("Jinx", id=222, play=4, kill=20, death=2, assist=4),
+            make_stats("Lux", id=99, play=1, kill=0, death=0, assist=3),
+        ]
+
+    def test_from_stats(self):
+        table = ChampionStatsTable.from_stats(self.stats)
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.champions, ["Ashe", "Jinx", "Lux"])
+        self.assertEqual(list(table["kill"]), [30, 20, 0])
+        self.assertEqual(sum(table["penta_kill"]), 1)
+        self.assertEqual(list(table["kda"]), [8.0, 12.0, 0])
+
+    def test_from_api_matches_from_stats(self):
+        rows = [{"id": 22, "play": 10, "kill": 30, "death": 10, "assist": 50}, {"id": 222, "kill": None}]
+        table = ChampionStatsTable.from_api(rows, champions_by_id={22: "Ashe"})
+
+        self.assertEqual(table.champions, ["Ashe", None])
+        self.assertEqual(list(table["kill"]), [30, 0])
+        self.assertEqual(list(table["kda"]), [8.0, 0])
+
+    def test_top(self):
+        table = ChampionStatsTable.from_stats(self.stats)
+
+        self.assertEqual(table.top("kda", 2), [("Jinx", 12.0), ("Ashe", 8.0)])
+        self.assertEqual(table.top("play", 1), [("Ashe", 10)])
+
+    def test_add(self):
+        table = ChampionStatsTable()
+        table.add(self.stats[1])
+
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.top("kill"), [("Jinx", 20)])
+
+
+class FrozenChampionTests(unittest.TestCase):
+    def test_champion_is_read_only(self):
+        champion = Champion.from_api({"id": 22, "key": "Ashe", "name": "Ashe", "spells": [{"key": "Q"}]})
+
+        with self.assertRaises(FrozenInstanceError):
+            champion.name = "Jinx"
+        with self.assertRaises(FrozenInstanceError):
+            champion.spells[0].key = "W"
+
+    def test_lazy_champion_still_builds_its_fields(self):
+        champion = Champion.from_api({"id": 22, "skins": [{"id": 1, "name": "Ashe"}]}, lazy=True)
+
+        self.assertEqual(len(champion.skins), 1)
+        with self.assertRaises(FrozenInstanceError):
+            champion.skins = ()
+
+
+class ReprTests(unittest.TestCase):
+    def test_skin_repr_follows_renames(self):
+        skin = Skin.from_api({"id": 1, "name": "Ashe"})
+        repr(skin)
+        skin.name = "Heartseeker Ashe"
+
+        self.assertEqual(repr(skin), "Skin(Heartseeker Ashe)")
+
+    def test_cached_reprs(self):
+        champion = Champion.from_api({"id": 22, "key": "Ashe", "name": "Ashe"})
+        stats = make_stats(champion, play=4, win=3, lose=1, kill=6, death=2, assist=4)
+
+        self.assertEqual(repr(champion), "Champion(id=22, key=Ashe, name=Ashe)")
+        self.assertIs(repr(stats), repr(stats))
+        self.assertIn("champion=Champion(id=22, key=Ashe, name=Ashe)", repr(stats))
+        self.assertIn("winrate: 75.0%", repr(stats))
+
+
+class ChampionStatsKdaTests(unittest.TestCase):
+    def test_kda_is_computed_at_construction(self):
+        self.assertEqual(make_stats("Ashe", kill=6, death=2, assist=4).kda, 5.0)
+        self.assertEqual(make_stats("Ashe", kill=6, death=0, assist=4).kda, 0)
+
+    def test_kda_cannot_go_stale(self):
+        stats = make_stats("Ashe", kill=6, death=2, assist=4)
+
+        with self.assertRaises(FrozenInstanceError):
+            stats.kill = 10
+        self.assertEqual(replace(stats, kill=10).kda, 7.0)
+
+
+class LazyChampionTests(unittest.TestCase):
+    def test_lazy_fields_are_built_on_first_access(self):
+        champion = Champion.from_api(RAW_CHAMPION, lazy=True)
+
+        self.assertEqual((champion.id, champion.key, champion.name), (22, "Ashe", "Ashe"))
+        # cost lookups don't need the skins to be built
+        self.assertEqual(champion.get_cost_by(By.BLUE_ESSENCE), 450)
+        self.assertEqual(champion.get_cost_by(By.RIOT_POINTS), 520)
+
+        self.assertIsInstance(champion.passive, Passive)
+        self.assertTrue(all(isinstance(spell, Spell) for spell in champion.spells))
+        self.assertTrue(all(isinstance(skin, Skin) for skin in champion.skins))
+        self.assertEqual([skin.id for skin in champion.skins], [22000, 22001])
+
+        # built once, then cached on the object
+        self.assertIs(champion.skins, champion.skins)
+
+    def test_lazy_matches_eager(self):
+        lazy, eager = Champion.from_api(RAW_CHAMPION, lazy=True), Champion.from_api(RAW_CHAMPION)
+
+        self.assertEqual(lazy.passive.name, eager.passive.name)
+        self.assertEqual([spell.name for spell in lazy.spells], [spell.name for spell in eager.spells])
+        self.assertEqual([skin.prices for skin in lazy.skins], [skin.prices for skin in eager.skins])
+
+    def test_unknown_attribute_still_raises(self):
+        with self.assertRaises(AttributeError):
+            Champion.from_api(RAW_CHAMPION, lazy=True).not_a_field
+
+
+class PricePoolTests(unittest.TestCase):
+    def test_equal_prices_share_one_object(self):
+        skins = [Skin.from_api({"id": i, "prices": [{"currency": "RP", "cost": 1350}]}) for i in range(3)]
+        prices = [skin.prices[0] for skin in skins]
+
+        self.assertEqual(prices[0], ("RP", 1350))
+        self.assertTrue(all(price is prices[0] for price in prices))
+
+    def test_different_prices_stay_separate(self):
+        rp, ip = Skin.from_api({"prices": [{"currency": "RP", "cost": 975}, {"currency": "IP", "cost": 975}]}).prices
+
+        self.assertIsNot(rp, ip)
+        self.assertEqual((rp.currency, ip.currency), ("RP", By.BLUE_ESSENCE))
+
+
+if __name__ == "__main__":
+    unittest.main()
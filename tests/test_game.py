@@ -0,0 +1,52 @@
+import os
+import sys
+import unittest
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from opgg.game import Stats, StatsTable
+from opgg.summoner import Game
+
+RAW_GAME = {
+    "id": "game-1",
+    "participants": [
+        {"champion_id": 22, "stats": {"kill": 3, "death": 1, "total_damage_dealt_to_champions": 12000}},
+        {"champion_id": 222, "stats": {"kill": 7, "death": None, "total_damage_dealt_to_champions": 18000}},
+    ],
+}
+
+
+class StatsTableTests(unittest.TestCase):
+    def test_from_stats(self):
+        table = StatsTable.from_stats(Stats.from_api(p["stats"]) for p in RAW_GAME["participants"])
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(list(table["kill"]), [3, 7])
+        self.assertEqual(list(table["death"]), [1, 0])
+        self.assertEqual(sum(table["total_damage_dealt_to_champions"]) / len(table), 15000)
+
+    def test_from_api_matches_from_stats(self):
+        rows = [p["stats"] for p in RAW_GAME["participants"]]
+        from_api = StatsTable.from_api(rows)
+        from_stats = StatsTable.from_stats(Stats.from_api(row) for row in rows)
+
+        self.assertEqual(from_api.columns, from_stats.columns)
+
+    def test_only_int_fields_are_columns(self):
+        self.assertIn("kill", StatsTable.INT_COLUMNS)
+        self.assertNotIn("result", StatsTable.INT_COLUMNS)
+        self.assertNotIn("op_score_timeline", StatsTable.INT_COLUMNS)
+
+    def test_game_build_stats_table(self):
+        table = Game.from_api(RAW_GAME).build_stats_table()
+
+        self.assertEqual(repr(table), "StatsTable(rows=2)")
+        self.assertEqual(list(table["kill"]), [3, 7])
+
+    def test_empty(self):
+        self.assertEqual(len(StatsTable()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+from opgg.opgg import OPGG
+from opgg.summoner import Game
+
+
+@unittest.skipIf(requests is None, "requests is not installed")
+class OPGGTestCase(unittest.TestCase):
+    def setUp(self):
+        # OPGG() creates ./logs and ./cache, keep them out of the repo
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp_dir.name)
+
+        # skip fake_useragent's database load
+        patcher = mock.patch.object(OPGG, "_ua", mock.Mock(random="test-agent"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.opgg = OPGG("summoner-id")
+        self.addCleanup(self.opgg.close)
+        self.opgg._session = mock.Mock()
+
+
+class SearchTests(OPGGTestCase):
+    def setUp(self):
+        super().setUp()
+        cached_ids = {"Doublelift#NA1": "id-1", "Sneaky#NA1": "id-2"}
+
+        self.opgg._cacher = mock.Mock()
+        self.opgg._cacher.get_summoner_id.side_effect = cached_ids.get
+        self.opgg._cacher.get_all_seasons.return_value = [mock.Mock(id=1)]
+        self.opgg._cacher.get_all_champs.return_value = [mock.Mock(id=22)]
+
+    def test_cached_summoners_are_fetched_concurrently(self):
+        # both lookups have to be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_summoner(summoner_id, **kwargs):
+            barrier.wait()
+            return mock.Mock(summoner_id=summoner_id)
+
+        with mock.patch.object(self.opgg, "get_summoner", side_effect=get_summoner):
+            summoners = self.opgg.search(["Doublelift#NA1", "Sneaky#NA1"])
+
+        self.assertEqual([summoner.summoner_id for summoner in summoners], ["id-1", "id-2"])
+        # the instance's own summoner isn't touched by a search
+        self.assertEqual(self.opgg.summoner_id, "summoner-id")
+
+    def test_scrape_is_skipped_when_everything_is_cached(self):
+        with mock.patch("opgg.utils.get_page_props") as get_page_props, mock.patch.object(self.opgg, "get_summoner"):
+            self.opgg.search("Doublelift#NA1")
+
+        get_page_props.assert_not_called()
+        self.assertEqual([season.id for season in self.opgg.all_seasons], [1])
+
+    def test_uncached_summoner_is_scraped(self):
+        page_props = {"summoners": [{"summoner_id": "id-3"}]}
+
+        with (
+            mock.patch("opgg.utils.get_page_props", return_value=page_props) as get_page_props,
+            mock.patch.object(self.opgg, "get_summoner", return_value=mock.Mock(summoner_id="id-3")) as get_summoner,
+        ):
+            self.opgg.search("Bjergsen#NA1")
+
+        get_page_props.assert_called_once_with(["Bjergsen#NA1"], self.opgg.region)
+        self.assertEqual(get_summoner.call_args.kwargs["summoner_id"], "id-3")
+
+
+class GetSummonerTests(OPGGTestCase):
+    LATENCY = 0.2
+
+    def setUp(self):
+        super().setUp()
+        self.summary = {"data": {"summoner": {"game_name": "Doublelift", "previous_seasons": [], "league_stats": []}}}
+
+        def get(url, **kwargs):
+            time.sleep(self.LATENCY)
+            body = self.summary if url.endswith("/summary") else {"data": []}
+            return mock.Mock(ok=True, text="", content=json.dumps(body).encode())
+
+        self.opgg._session.get.side_effect = get
+
+    def test_games_request_overlaps_summary_request(self):
+        start = time.perf_counter()
+        summoner = self.opgg.get_summoner()
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(summoner.game_name, "Doublelift")
+        self.assertEqual(self.opgg._session.get.call_count, 2)
+        # back to back the two requests would take 2 * LATENCY
+        self.assertLess(elapsed, self.LATENCY * 1.75)
+
+    def test_empty_summary_is_returned_as_is(self):
+        self.summary = {"data": {}}
+
+        with self.assertLogs("OPGG.py", level="ERROR"):
+            self.assertEqual(self.opgg.get_summoner(), {})
+
+
+GAMES = [
+    {"id": "game-1", "participants": [{"champion_id": 22, "stats": {"kill": 3}}], "teams": [{"key": "BLUE"}]},
+    {"id": "game-2", "participants": [], "teams": []},
+]
+
+
+class GetRecentGamesTests(OPGGTestCase):
+    def setUp(self):
+        super().setUp()
+        self.opgg._session.get.return_value = mock.Mock(ok=True, text="", content=json.dumps({"data": GAMES}).encode())
+
+    def test_games_are_cached_until_refresh(self):
+        first = self.opgg.get_recent_games()
+        second = self.opgg.get_recent_games()
+        self.opgg.get_recent_games(refresh=True)
+
+        self.assertEqual([game.id for game in second], ["game-1", "game-2"])
+        self.assertEqual([game.id for game in first], [game.id for game in second])
+        self.assertEqual(self.opgg._session.get.call_count, 2)
+
+    def test_cache_hit_returns_a_copy(self):
+        self.opgg.get_recent_games().clear()
+        games = self.opgg.get_recent_games()
+        games.pop()
+
+        self.assertEqual(len(self.opgg.get_recent_games()), 2)
+        self.assertEqual(self.opgg._session.get.call_count, 1)
+
+    def test_update_invalidates_cached_games(self):
+        self.opgg.get_recent_games()
+
+        with mock.patch("opgg.utils.update", return_value={"status": 200}) as update:
+            self.assertEqual(self.opgg.update(), {"status": 200})
+
+        update.assert_called_once_with("summoner-id", self.opgg.region)
+        self.opgg.get_recent_games()
+        self.assertEqual(self.opgg._session.get.call_count, 2)
+
+    def test_update_many_invalidates_cached_games(self):
+        self.opgg.get_recent_games()
+        self.opgg.get_recent_games(summoner_id="other-id")
+
+        with mock.patch("opgg.utils.update_many", return_value=[{}]):
+            self.opgg.update_many(["other-id"])
+
+        self.opgg.get_recent_games()
+        self.opgg.get_recent_games(summoner_id="other-id")
+        self.assertEqual(self.opgg._session.get.call_count, 3)
+
+    def test_malformed_game_is_skipped(self):
+        # a team without a key can't be built
+        bad_game = {"id": "bad", "participants": [], "teams": [{"game_stat": {}}]}
+        body = {"data": [GAMES[0], bad_game, GAMES[1]]}
+        self.opgg._session.get.return_value = mock.Mock(ok=True, text="", content=json.dumps(body).encode())
+
+        with self.assertLogs("OPGG.py", level="ERROR") as logs:
+            games = self.opgg.get_recent_games()
+
+        self.assertEqual([game.id for game in games], ["game-1", "game-2"])
+        self.assertTrue(all(isinstance(game, Game) for game in games))
+        self.assertIn("bad", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
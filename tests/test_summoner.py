@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from opgg.summoner import Participant, Summoner
+
+
+class ParticipantReprTests(unittest.TestCase):
+    def test_repr_of_participant_from_api(self):
+        participant = Participant.from_api(
+            {
+                "summoner": {"game_name": "Doublelift", "tagline": "NA1"},
+                "champion_id": 22,
+                "position": "ADC",
+                "stats": {"kill": 3, "death": 1, "assist": 7},
+            }
+        )
+
+        self.assertEqual(repr(participant), "Participant(summoner=Doublelift, champion_id=22, position=ADC)")
+
+    def test_repr_of_participant_with_missing_sub_dicts(self):
+        self.assertIn("Participant(", repr(Participant.from_api({})))
+
+    def test_summoner_repr_without_lists(self):
+        text = repr(Summoner.from_api({"game_name": "Doublelift"}))
+
+        self.assertIn("[Summoner: Doublelift]", text)
+        self.assertIn("[List (0)]", text)
+
+
+class SummonerFromApiTests(unittest.TestCase):
+    def test_api_fields_map_by_name(self):
+        summoner = Summoner.from_api({"summoner_id": "abc", "level": 30, "renewable_at": "soon"}, league_stats=[])
+
+        self.assertEqual((summoner.summoner_id, summoner.level, summoner.renewable_at), ("abc", 30, "soon"))
+        self.assertIsNone(summoner.game_name)
+        self.assertEqual(summoner.league_stats, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add module to path to reference opgg subdir from here.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+from opgg.champion import Champion
+from opgg.params import By, Region
+from opgg.season import SeasonInfo
+
+if requests is not None:
+    from opgg import utils
+
+CHAMPIONS = (
+    Champion.from_api(
+        {"id": 22, "key": "Ashe", "name": "Ashe", "skins": [{"prices": [{"currency": "IP", "cost": 450}]}]}
+    ),
+    Champion.from_api(
+        {"id": 222, "key": "Jinx", "name": "Jinx", "skins": [{"prices": [{"currency": "IP", "cost": 6300}]}]}
+    ),
+)
+
+SEASONS = (
+    SeasonInfo(id=25, value=14, display_value=2024, split=1, is_preseason=False),
+    SeasonInfo(id=27, value=14, display_value=2024, split=2, is_preseason=False),
+)
+
+
+def mock_response(data: dict) -> mock.Mock:
+    return mock.Mock(ok=True, content=json.dumps(data).encode())
+
+
+@unittest.skipIf(requests is None, "requests is not installed")
+class GetChampionByTests(unittest.TestCase):
+    def setUp(self):
+        utils.get_all_champions.cache_clear()
+        patcher = mock.patch.object(utils, "_fetch_all_champions", return_value=CHAMPIONS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(utils.get_all_champions.cache_clear)
+
+    def test_single_values(self):
+        self.assertEqual(utils.get_champion_by(By.ID, "22").name, "Ashe")
+        self.assertEqual(utils.get_champion_by(By.KEY, "Jinx").id, 222)
+        self.assertEqual(utils.get_champion_by(By.NAME, "Ashe").id, 22)
+        self.assertEqual(utils.get_champion_by(By.COST, 6300, currency=By.BLUE_ESSENCE).name, "Jinx")
+
+    def test_list_values(self):
+        self.assertEqual([champ.id for champ in utils.get_champion_by(By.ID, [22, 222, 1])], [22, 222])
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(utils.get_champion_by(By.ID, 1))
+        self.assertIsNone(utils.get_champion_by(By.NAME, "Teemo"))
+        self.assertIsNone(utils.get_champion_by(By.KEY, ["Teemo"]))
+        self.assertIsNone(utils.get_champion_by(By.COST, 1, currency=By.RIOT_POINTS))
+
+    def test_page_props(self):
+        page_props = {"championsById": {"1": {"id": 1, "key": "Annie", "name": "Annie"}}}
+
+        self.assertEqual(utils.get_champion_by(By.NAME, "Annie", page_props=page_props).id, 1)
+        self.assertIsNone(utils.get_champion_by(By.NAME, "Ashe", page_props=page_props))
+
+
+@unittest.skipIf(requests is None, "requests is not installed")
+class GetSeasonByTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(utils, "get_all_seasons", return_value=list(SEASONS))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hits(self):
+        self.assertEqual(utils.get_season_by(By.ID, "27").split, 2)
+        self.assertEqual(utils.get_season_by(By.ID, [25, 27, 1]), list(SEASONS))
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(utils.get_season_by(By.ID, 1))
+        self.assertIsNone(utils.get_season_by(By.ID, [1, 2]))
+
+
+@unittest.skipIf(requests is None, "requests is not installed")
+class UpdateManyTests(unittest.TestCase):
+    def setUp(self):
+        def post(url):
+            summoner_id = url.rsplit("/", 2)[-2]
+            return mock_response({"status": 202, "data": {"summoner_id": summoner_id}})
+
+        patcher = mock.patch.object(utils, "_SESSION")
+        self.session = patcher.start()
+        self.session.post.side_effect = post
+        self.addCleanup(patcher.stop)
+
+    def test_results_keep_input_order(self):
+        summoner_ids = [f"id-{i}" for i in range(12)]
+        results = utils.update_many(summoner_ids, Region.EUW)
+
+        self.assertEqual([res["data"]["summoner_id"] for res in results], summoner_ids)
+        self.assertEqual(self.session.post.call_count, 12)
+        self.assertTrue(all("/EUW/" in call.args[0] for call in self.session.post.call_args_list))
+
+    def test_empty_and_single(self):
+        self.assertEqual(utils.update_many([]), [])
+        self.assertEqual(utils.update_many(["solo"])[0]["data"]["summoner_id"], "solo")
+
+
+@unittest.skipIf(requests is None, "requests is not installed")
+class GetPagePropsTests(unittest.TestCase):
+    PAGE_PROPS = {"summoners": [{"summoner_id": "abc"}], "seasonsById": {}}
+
+    def setUp(self):
+        patcher = mock.patch.object(utils, "_SESSION")
+        self.session = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_page_props(self, script: str) -> dict:
+        html = f"<html><head></head><body><div>...</div>{script}</body></html>"
+        self.session.get.return_value = mock.Mock(content=html.encode())
+        return utils.get_page_props(["Doublelift#NA1", "Sneaky#NA1"], Region.NA)
+
+    def test_next_data_regex(self):
+        data = json.dumps({"props": {"pageProps": self.PAGE_PROPS}})
+
+        with mock.patch("bs4.BeautifulSoup") as soup:
+            page_props = self.get_page_props(f'<script id="__NEXT_DATA__" type="application/json">{data}</script>')
+
+        self.assertEqual(page_props, self.PAGE_PROPS)
+        # the regex hit means the html parser is never needed
+        soup.assert_not_called()
+        self.assertIn("summoners=Doublelift#NA1,Sneaky#NA1", self.session.get.call_args.args[0])
+
+    def test_falls_back_to_html_parser(self):
+        data = json.dumps({"props": {"pageProps": self.PAGE_PROPS}})
+
+        page_props = self.get_page_props(f'<script type="application/json" id="__NEXT_DATA__">{data}</script>')
+
+        self.assertEqual(page_props, self.PAGE_PROPS)
+
+    def test_bad_json_returns_empty_dict(self):
+        self.assertEqual(self.get_page_props('<script id="__NEXT_DATA__">{not json</script>'), {})
+
+
+if __name__ == "__main__":
+    unittest.main()